@@ -5,19 +5,27 @@ print("Opening Camera...")
 cap = cv2.VideoCapture(0)
 cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
 cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+# ドライバ側のキューを1枚にして古いフレームを溜めない / MJPEG で帯域とデコード負荷を下げる
+ok_buf = cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+ok_fourcc = cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+print(f"CAP_PROP_BUFFERSIZE=1: {ok_buf}, FOURCC=MJPG: {ok_fourcc}")
 
 if not cap.isOpened():
     print("Error: Could not open camera.")
     exit()
 
-print("Warming up camera (30 frames)...")
-# 露出安定のため空読み
-for _ in range(30):
-    cap.read()
+WARMUP_FRAMES = 5
+
+print(f"Warming up camera ({WARMUP_FRAMES} frames)...")
+# 露出安定のため空読み（grab のみでデコードしない）
+for _ in range(WARMUP_FRAMES):
+    cap.grab()
     time.sleep(0.05)
 
 print("Capturing...")
-ret, frame = cap.read()
+ret = cap.grab()
+if ret:
+    ret, frame = cap.retrieve()
 
 if ret:
     cv2.imwrite("test_capture.jpg", frame)
@@ -1,8 +1,12 @@
+import math
+import threading
 import time
 import board
 import busio
 import adafruit_ssd1306
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
+from smbus2 import SMBus, i2c_msg
 
 # I2C Setup
 i2c = busio.I2C(board.SCL, board.SDA)
@@ -11,14 +15,106 @@ i2c = busio.I2C(board.SCL, board.SDA)
 # 薄型OLED(128x32)の設定です。表示が崩れる場合は HEIGHT=64 を試してください。
 WIDTH = 128
 HEIGHT = 32
-oled = adafruit_ssd1306.SSD1306_I2C(WIDTH, HEIGHT, i2c, addr=0x3C)
+PAGES = HEIGHT // 8
+OLED_ADDR = 0x3C
+oled = adafruit_ssd1306.SSD1306_I2C(WIDTH, HEIGHT, i2c, addr=OLED_ADDR)
 
-# --- 画面描画設定 (PIL使用) ---
+# 転送用に smbus2 を併用（フレームバッファを1回の I2C トランザクションで送る）
+bus = SMBus(1)
+
+
+def oled_command(*cmds):
+    # 0x00 (Co=0, D/C=0) の後ろに続くバイトはすべてコマンドとして解釈される
+    bus.i2c_rdwr(i2c_msg.write(OLED_ADDR, bytes((0x00,) + cmds)))
+
+
+def fast_show(frame=None):
+    # 水平アドレッシングで全列/全ページを指定し、0x40 + バッファを一括送信
+    # (oled.buffer は先頭に 0x40 制御バイトを含む。frame 指定時はその内容を送る)
+    oled_command(0x21, 0, WIDTH - 1, 0x22, 0, PAGES - 1)
+    data = oled.buffer if frame is None else b"\x40" + frame
+    bus.i2c_rdwr(i2c_msg.write(OLED_ADDR, data))
+
+
+def dirty_rect(prev, cur):
+    # 前回送信分と比較し、変化したページ範囲と列範囲を返す（変化なしなら None）
+    page_start = page_end = None
+    col_start = WIDTH
+    col_end = -1
+    for page in range(PAGES):
+        base = page * WIDTH
+        if prev[base : base + WIDTH] == cur[base : base + WIDTH]:
+            continue
+        if page_start is None:
+            page_start = page
+        page_end = page
+        x0 = 0
+        while prev[base + x0] == cur[base + x0]:
+            x0 += 1
+        x1 = WIDTH - 1
+        while prev[base + x1] == cur[base + x1]:
+            x1 -= 1
+        col_start = min(col_start, x0)
+        col_end = max(col_end, x1)
+    if page_start is None:
+        return None
+    return col_start, col_end, page_start, page_end
+
+
+_prev_frame = None
+
+
+def show_dirty(cur):
+    # 変化した矩形（ページ単位）だけを送る。初回は全面転送
+    global _prev_frame
+    if _prev_frame is None:
+        fast_show(cur)
+        _prev_frame = cur
+        return
+    rect = dirty_rect(_prev_frame, cur)
+    _prev_frame = cur
+    if rect is None:
+        return
+    col_start, col_end, page_start, page_end = rect
+    oled_command(0x21, col_start, col_end, 0x22, page_start, page_end)
+    data = bytearray([0x40])
+    for page in range(page_start, page_end + 1):
+        base = page * WIDTH
+        data += cur[base + col_start : base + col_end + 1]
+    bus.i2c_rdwr(i2c_msg.write(OLED_ADDR, data))
+
+
+# --- 転送スレッド ---
+# 描画側は page_buf を更新して dirty を立てるだけ。I2C 転送は別スレッドがまとめて行うので、
+# 転送が追いつかない間に何度描画されても送るのは最新の1フレームだけになる。
+dirty = threading.Event()
+stop_flush = threading.Event()
+buffer_lock = threading.Lock()
+
+
+def flush_worker():
+    while not stop_flush.is_set():
+        if not dirty.wait(0.5):
+            continue
+        dirty.clear()
+        with buffer_lock:
+            cur = page_buf.tobytes()
+        try:
+            show_dirty(cur)
+        except OSError as e:
+            print(f"OLED write error: {e}")
+
+
+flush_thread = threading.Thread(target=flush_worker, name="oled_flush", daemon=True)
+
+
+# --- 画面描画設定 (NumPy ページバッファ、文字タイルのみ PIL で描画) ---
 oled.fill(0)
 oled.show()
 
-image = Image.new("1", (oled.width, oled.height))
-draw = ImageDraw.Draw(image)
+# SSD1306 と同じページ順 (1byte = 縦8px, LSB が上) のフレームバッファ。
+# PIL 画像 -> oled.image() の変換を毎フレーム行わず、ここへ直接タイルを書き込む
+page_buf = np.zeros((PAGES, WIDTH), dtype=np.uint8)
 
 # フォント設定 (システムフォント DejaVuSansを使用)
 try:
@@ -31,35 +127,84 @@ TOP_MARGIN = 0
 LINE_HEIGHT = 16
 SPINNER = ["-", "\\", "|", "/"]
 
-start_time = time.time()
+
+def to_pages(img):
+    # 1bit 画像 (高さは8の倍数) をページ順のバイト配列 (pages, width) に変換する
+    bits = np.asarray(img, dtype=np.uint8)
+    h, w = bits.shape
+    return np.packbits(bits.reshape(h // 8, 8, w), axis=1, bitorder="little")[:, 0, :]
+
+
+def render_tile(text, width=None):
+    # 文字列を1行分の高さでラスタライズし、ページ順のバイト配列にしておく
+    w = width or max(1, int(math.ceil(font.getlength(text))))
+    tile = Image.new("1", (w, LINE_HEIGHT))
+    ImageDraw.Draw(tile).text((0, 0), text, font=font, fill=255)
+    return to_pages(tile)
+
+
+def blit(tile, page, x):
+    # タイルを page_buf に書き込む（画面右端ではみ出し分を切り捨て）
+    w = min(tile.shape[1], WIDTH - x)
+    if w > 0:
+        page_buf[page : page + tile.shape[0], x : x + w] = tile[:, :w]
+    return x + tile.shape[1]
+
+
+# 1行目（固定文字列）はループ外で一度だけラスタライズし、毎回書き込む
+title_tile = render_tile("DMC AI MOBILITY", width=WIDTH)
+
+# 2行目は固定の "Uptime " と、数字/記号/スピナーのグリフをキャッシュして貼り合わせる
+uptime_prefix_tile = render_tile("Uptime ")
+glyph_cache = {ch: render_tile(ch) for ch in "0123456789: " + "".join(SPINNER)}
+LINE_PAGES = LINE_HEIGHT // 8
+
+flush_thread.start()
+
+# 経過時間は monotonic_ns の整数演算で求める（時計合わせの影響も受けない）
+t0 = time.monotonic_ns()
 spinner_index = 0
+period_s = 1.0
+next_t = time.monotonic()
 
 try:
     while True:
-        elapsed = int(time.time() - start_time)
+        elapsed = (time.monotonic_ns() - t0) // 1_000_000_000
         minutes, seconds = divmod(elapsed, 60)
         spinner = SPINNER[spinner_index % len(SPINNER)]
         spinner_index += 1
 
-        # 描画クリア
-        draw.rectangle((0, 0, oled.width, oled.height), outline=0, fill=0)
-
-        # テキスト描画
-        # 1行目: ロボット識別と状態
-        draw.text((0, TOP_MARGIN), "DMC AI MOBILITY", font=font, fill=255)
+        # ページバッファへ直接描画し、転送は flush スレッドに任せる
+        with buffer_lock:
+            page_buf.fill(0)
 
-        # 2行目: 稼働状況＋スピナー
-        if HEIGHT >= 32:
-            draw.text((0, TOP_MARGIN + LINE_HEIGHT), f"Uptime {minutes:02d}:{seconds:02d} {spinner}", font=font, fill=255)
+            # 1行目: ロボット識別と状態
+            top_page = TOP_MARGIN // 8
+            blit(title_tile, top_page, 0)
 
-        # 転送
-        oled.image(image)
-        oled.show()
+            # 2行目: 稼働状況＋スピナー
+            if HEIGHT >= 32:
+                page = top_page + LINE_PAGES
+                x = blit(uptime_prefix_tile, page, 0)
+                for ch in f"{minutes:02d}:{seconds:02d} {spinner}":
+                    x = blit(glyph_cache[ch], page, x)
+        dirty.set()
 
         print(f"OLED updated, uptime {minutes:02d}:{seconds:02d}")
-        time.sleep(1)
+        # 処理時間を差し引いて周期を保つ（遅れた場合は基準を取り直す）
+        next_t += period_s
+        sleep_for = next_t - time.monotonic()
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+        else:
+            next_t = time.monotonic()
 
 except KeyboardInterrupt:
+    stop_flush.set()
+    flush_thread.join(timeout=1.0)
     oled.fill(0)
     oled.show()
     print("Test finished")
+finally:
+    stop_flush.set()
+    bus.close()
@@ -1,12 +1,30 @@
+import asyncio
 import json
-import time
+import struct
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from mpu9250_jmdev.registers import *
 from mpu9250_jmdev.mpu_9250 import MPU9250
 
 CONFIG_PATH = Path(__file__).resolve().parents[1] / "configs" / "imu_config.json"
 
+MPU_ADDR = 0x68
+ACCEL_XOUT_H = 0x3B
+# ACCEL(0x3B..0x40) / TEMP(0x41..0x42) / GYRO(0x43..0x48) は連続したレジスタなので 14byte で一括取得できる
+_ACCEL_TEMP_GYRO_STRUCT = struct.Struct(">hhhhhhh")
+
 
 def load_offsets(path):
     offsets = {
@@ -30,10 +48,17 @@ def load_offsets(path):
     return offsets
 
 
+def offset_vectors(offsets):
+    # dict は保存用。読み出しループでは事前に作ったベクトルを引くだけにする
+    gyro_off = np.array([offsets["gx_off"], offsets["gy_off"], offsets["gz_off"]], dtype=np.float64)
+    accel_off = np.array([offsets["ax_off"], offsets["ay_off"], offsets["az_off"]], dtype=np.float64)
+    return gyro_off, accel_off
+
+
 def create_mpu():
     mpu = MPU9250(
         bus=1,
-        address_mpu_master=0x68,
+        address_mpu_master=MPU_ADDR,
         gfs=GFS_1000,
         afs=AFS_8G,
         mfs=AK8963_BIT_16,
@@ -48,13 +73,37 @@ def create_mpu():
     return mpu
 
 
-def read_calibrated_gyro(mpu, offsets):
-    gx, gy, gz = mpu.readGyroscopeMaster()
-    return (
-        gx - offsets["gx_off"],
-        gy - offsets["gy_off"],
-        gz - offsets["gz_off"],
-    )
+def _calibrate(raw, off, scale):
+    return raw.astype(np.float64) * scale - off
+
+
+# 生値 -> 物理量 -> オフセット補正。numba があればネイティブコードにコンパイルする
+calibrate = njit(cache=True, fastmath=True)(_calibrate) if njit is not None else _calibrate
+
+
+def read_raw_accel_gyro(bus, addr=MPU_ADDR):
+    # (ax, ay, az, temp, gx, gy, gz) の int16 配列
+    data = bus.read_i2c_block_data(addr, ACCEL_XOUT_H, 14)
+    return np.array(_ACCEL_TEMP_GYRO_STRUCT.unpack_from(bytes(data)), dtype=np.int16)
+
+
+def get_block_bus(mpu):
+    # ドライバが持つ smbus と分解能 (gres/ares) を使えれば、軸ごとの読み出しを省いてブロックリードする
+    bus = getattr(mpu, "bus", None)
+    if hasattr(bus, "read_i2c_block_data") and hasattr(mpu, "gres") and hasattr(mpu, "ares"):
+        return bus
+    return None
+
+
+def block_calibration(mpu, gyro_off, accel_off):
+    # ドライバの変換 (raw * res - bias) と同じスケール・バイアスに、設定ファイルのオフセットを足し込む
+    gyro_bias = np.asarray(getattr(mpu, "gbias", (0.0, 0.0, 0.0)), dtype=np.float64) + gyro_off
+    accel_bias = np.asarray(getattr(mpu, "abias", (0.0, 0.0, 0.0)), dtype=np.float64) + accel_off
+    return float(mpu.gres), gyro_bias, float(mpu.ares), accel_bias
+
+
+def read_calibrated_gyro(reader, gyro_off):
+    return calibrate(np.asarray(reader(), dtype=np.float64), gyro_off, 1.0)
 
 
 def get_accel_reader(mpu):
@@ -65,29 +114,51 @@ def get_accel_reader(mpu):
     return None
 
 
-def read_calibrated_accel(reader, offsets):
-    ax, ay, az = reader()
-    return (
-        ax - offsets["ax_off"],
-        ay - offsets["ay_off"],
-        az - offsets["az_off"],
-    )
+def read_calibrated_accel(reader, accel_off):
+    return calibrate(np.asarray(reader(), dtype=np.float64), accel_off, 1.0)
+
+
+def read_block_sample(bus, addr, calib):
+    # 1回の I2C トランザクションで加速度とジャイロをまとめて読む
+    gyro_scale, gyro_bias, accel_scale, accel_bias = calib
+    raw = read_raw_accel_gyro(bus, addr)
+    return calibrate(raw[4:], gyro_bias, gyro_scale), calibrate(raw[:3], accel_bias, accel_scale)
+
+
+def read_driver_sample(gyro_reader, accel_reader, gyro_off, accel_off):
+    # ドライバ経由（dps / g に変換済み）で軸ごとに読む
+    gyro = read_calibrated_gyro(gyro_reader, gyro_off)
+    accel = read_calibrated_accel(accel_reader, accel_off) if accel_reader is not None else None
+    return gyro, accel
 
 
-def main():
+async def main():
     offsets = load_offsets(CONFIG_PATH)
+    gyro_off, accel_off = offset_vectors(offsets)
     mpu = create_mpu()
 
-    accel_reader = get_accel_reader(mpu)
-    if accel_reader is None:
-        print("Accelerometer read is not available in this MPU driver.")
+    block_bus = get_block_bus(mpu)
+    if block_bus is not None:
+        addr = getattr(mpu, "address_mpu_master", MPU_ADDR)
+        read_args = (block_bus, addr, block_calibration(mpu, gyro_off, accel_off))
+        read_sample = read_block_sample
+    else:
+        accel_reader = get_accel_reader(mpu)
+        if accel_reader is None:
+            print("Accelerometer read is not available in this MPU driver.")
+        read_args = (mpu.readGyroscopeMaster, accel_reader, gyro_off, accel_off)
+        read_sample = read_driver_sample
 
     print("Reading IMU (Ctrl+C to stop)")
+    period_s = 0.2
+    loop = asyncio.get_running_loop()
+    next_t = loop.time()
     while True:
         try:
-            gx, gy, gz = read_calibrated_gyro(mpu, offsets)
-            if accel_reader is not None:
-                ax, ay, az = read_calibrated_accel(accel_reader, offsets)
+            # I2C 読み出しはワーカースレッドで行い、イベントループを止めない
+            (gx, gy, gz), accel = await asyncio.to_thread(read_sample, *read_args)
+            if accel is not None:
+                ax, ay, az = accel
                 print(
                     f"gyro(dps) gx={gx:.3f} gy={gy:.3f} gz={gz:.3f} | "
                     f"accel(g) ax={ax:.3f} ay={ay:.3f} az={az:.3f}"
@@ -96,8 +167,18 @@ def main():
                 print(f"gyro(dps) gx={gx:.3f} gy={gy:.3f} gz={gz:.3f}")
         except Exception as e:
             print(f"Read error: {e}")
-        time.sleep(0.2)
+        # 処理時間を差し引いて周期を保つ（遅れた場合は基準を取り直す）
+        next_t += period_s
+        delay = next_t - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            next_t = loop.time()
 
 
 if __name__ == "__main__":
-    main()
+    # uvloop があれば使う（無ければ標準の asyncio ループ）
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -3,11 +3,13 @@ from __future__ import annotations
 import argparse
 import math
 import sys
-import time
-from typing import Iterable, Optional
+import threading
+from typing import Optional
 
+import numpy as np
+
+from dmc_ai_mobility.core.timing import PeriodicSleeper
 from dmc_ai_mobility.drivers.lidar import (
-    LidarPoint,
     LidarScan,
     MockLidarDriver,
     YdLidarConfig,
@@ -15,22 +17,18 @@ from dmc_ai_mobility.drivers.lidar import (
 )
 
 
-def _front_points(points: Iterable[LidarPoint], window_deg: float) -> list[float]:
-    half = max(float(window_deg), 0.0) / 2.0
-    dists: list[float] = []
-    for p in points:
-        angle_deg = math.degrees(p.angle_rad)
-        if abs(angle_deg) <= half:
-            dists.append(p.range_m)
-    return dists
+def _front_points(angles_rad: np.ndarray, ranges_m: np.ndarray, window_deg: float) -> np.ndarray:
+    half_rad = math.radians(max(float(window_deg), 0.0)) / 2.0
+    return ranges_m[np.abs(angles_rad) <= half_rad]
 
 
-def _stat(dists: list[float], mode: str) -> Optional[float]:
-    if not dists:
+def _stat(dists: np.ndarray, mode: str) -> Optional[float]:
+    if dists.size == 0:
         return None
+    # Only the requested reduction: one pass over the window either way.
     if mode == "min":
-        return min(dists)
-    return sum(dists) / len(dists)
+        return float(dists.min())
+    return float(dists.mean())
 
 
 def main(argv: list[str]) -> int:
@@ -51,19 +49,45 @@ def main(argv: list[str]) -> int:
         driver = YdLidarDriver(cfg)
         print("LiDAR Running! (Press Ctrl+C to stop)")
 
-    period_s = 1.0 / max(float(args.hz), 1.0)
+    hz = max(float(args.hz), 1.0)
+    period_s = 1.0 / hz
+
+    # The reader thread keeps consuming scans (read() blocks on serial I/O) and only
+    # keeps the newest one; the print loop takes whatever is latest at its own rate.
+    latest: list[Optional[LidarScan]] = [None]
+    lock = threading.Lock()
+    stop_event = threading.Event()
+    # The mock driver returns immediately; pace it so the reader does not spin.
+    reader_idle_s = period_s if args.mock else 0.0
+
+    def reader() -> None:
+        while not stop_event.is_set():
+            scan = driver.read()
+            if scan is not None:
+                with lock:
+                    latest[0] = scan
+            if reader_idle_s > 0.0:
+                stop_event.wait(reader_idle_s)
+
+    reader_thread = threading.Thread(target=reader, name="lidar_reader", daemon=True)
+    reader_thread.start()
+    sleeper = PeriodicSleeper(hz)
     try:
         while True:
-            scan: Optional[LidarScan] = driver.read()
+            with lock:
+                scan: Optional[LidarScan] = latest[0]
+                latest[0] = None
             if scan is not None:
-                front = _front_points(scan.points, window_deg=args.window_deg)
+                front = _front_points(scan.angles_rad, scan.ranges_m, window_deg=args.window_deg)
                 value = _stat(front, args.stat)
                 if value is not None:
                     print(f"Front({args.stat}): {value:.3f} m  (Samples: {len(front)})")
-            time.sleep(period_s)
+            sleeper.sleep()
     except KeyboardInterrupt:
         print("\nStopping...")
     finally:
+        stop_event.set()
+        reader_thread.join(timeout=1.0)
         driver.close()
     return 0
 
@@ -49,14 +49,77 @@ pi = pigpio.pi()
 if not pi.connected:
     exit()
 
+# speed(-100〜100) -> パルス幅 (1500 + speed * 5) の対応表。PW_TABLE[speed + 100] で引く
+PW_TABLE = tuple(STOP + s * 5 for s in range(-100, 101))
+
+# 両輪のパルスを1本のDMAウェーブ(20ms周期)にまとめて送る。
+# set_servo_pulsewidth を2回呼ぶと左右の更新が1周期ずれるため、同じ立ち上がりで出力する。
+SERVO_FRAME_US = 20000
+pi.set_mode(PIN_L, pigpio.OUTPUT)
+pi.set_mode(PIN_R, pigpio.OUTPUT)
+pi.wave_clear()
+
+# 最後に送ったパルス幅。同じ値なら pigpiod への送信を省略する
+_last_pw = (None, None)
+
+_wave_id = None
+
+
+def servo_wave_pulses(pw_l, pw_r):
+    # パルス幅 0 のピンはLowのまま (PWM停止)
+    widths = sorted((int(pw), pin) for pin, pw in ((PIN_L, pw_l), (PIN_R, pw_r)) if pw > 0)
+    if not widths:
+        return []
+    on_mask = 0
+    for _, pin in widths:
+        on_mask |= 1 << pin
+    # 全ピンを同時に立ち上げ、短いパルスから順に立ち下げる
+    pulses = [pigpio.pulse(on_mask, 0, widths[0][0])]
+    for i, (pw, pin) in enumerate(widths):
+        next_t = widths[i + 1][0] if i + 1 < len(widths) else SERVO_FRAME_US
+        pulses.append(pigpio.pulse(0, 1 << pin, next_t - pw))
+    return pulses
+
+
+def send_servo_wave(pw_l, pw_r):
+    global _wave_id
+    pulses = servo_wave_pulses(pw_l, pw_r)
+    old_id = _wave_id
+    if not pulses:
+        stop_servo_wave()
+        return
+    pi.wave_add_generic(pulses)
+    _wave_id = pi.wave_create()
+    # 現在のウェーブの周期末で切り替える
+    pi.wave_send_using_mode(_wave_id, pigpio.WAVE_MODE_REPEAT_SYNC)
+    if old_id is not None:
+        deadline = time.monotonic() + SERVO_FRAME_US * 2 / 1e6
+        while pi.wave_tx_at() == old_id and time.monotonic() < deadline:
+            time.sleep(0.001)
+        pi.wave_delete(old_id)
+
+
+def stop_servo_wave():
+    global _wave_id
+    pi.wave_tx_stop()
+    if _wave_id is not None:
+        pi.wave_delete(_wave_id)
+        _wave_id = None
+    pi.write(PIN_L, 0)
+    pi.write(PIN_R, 0)
+
+
 def set_motor(speed_l, speed_r):
+    global _last_pw
+
     # speedは -100(full back) 〜 100(full forward) とする
-    # 1500 + (speed * 5) でパルス幅計算
-    pw_l = STOP + (speed_l * 5)
-    pw_r = STOP - (speed_r * 5) # 右モータは物理的に逆向きなので符号反転
-    
-    pi.set_servo_pulsewidth(PIN_L, pw_l)
-    pi.set_servo_pulsewidth(PIN_R, pw_r)
+    pw_l = PW_TABLE[speed_l + 100]
+    pw_r = PW_TABLE[-speed_r + 100] # 右モータは物理的に逆向きなので符号反転
+
+    if _last_pw == (pw_l, pw_r):
+        return
+    send_servo_wave(pw_l, pw_r)
+    _last_pw = (pw_l, pw_r)
 
 try:
     print("Forward")
@@ -82,6 +145,5 @@ try:
 finally:
     print("Stopping motors...")
     set_motor(0, 0)
-    pi.set_servo_pulsewidth(PIN_L, 0) # PWM停止
-    pi.set_servo_pulsewidth(PIN_R, 0)
+    stop_servo_wave() # PWM停止
     pi.stop()
@@ -57,6 +57,17 @@ def load_trim(path):
     return 0.0
 
 
+# 最後に送ったパルス幅。同じ値なら pigpiod への送信を省略する
+_last_pw = {}
+
+
+def _set_pulsewidth(pi, pin, pw):
+    if _last_pw.get(pin) == pw:
+        return
+    pi.set_servo_pulsewidth(pin, pw)
+    _last_pw[pin] = pw
+
+
 def drive(pi, speed, trim):
     l_factor = 1.0
     r_factor = 1.0
@@ -69,8 +80,8 @@ def drive(pi, speed, trim):
     pw_l = 1500 + (speed * l_factor * 5)
     pw_r = 1500 - (speed * r_factor * 5)
 
-    pi.set_servo_pulsewidth(PIN_L, pw_l)
-    pi.set_servo_pulsewidth(PIN_R, pw_r)
+    _set_pulsewidth(pi, PIN_L, pw_l)
+    _set_pulsewidth(pi, PIN_R, pw_r)
 
 
 def main():
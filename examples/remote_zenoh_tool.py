@@ -6,124 +6,584 @@ Remote Zenoh control/subscription tool for this repository.
 
 Usage and Zenoh connection configuration examples are documented in:
   doc/remote_pubsub/zenoh_remote_pubsub.md
+
+Publisher QoS is chosen per topic (_declare_publisher):
+- motor/cmd (motor, stop): Priority.REAL_TIME, CongestionControl.DROP, express. A
+  newer command supersedes an older one and the robot stops on deadman timeout, so
+  stale commands are dropped rather than queued, and each command is sent at once
+  instead of waiting for Zenoh's batching.
+- camera/* (camera-h264 --republish-jpeg): Priority.DATA_HIGH, batched (not express).
+- oled/* (oled, oled-image): Priority.DATA_LOW.
 """
 
 import argparse
+import atexit
+import collections
+import functools
 import json
 import math
+import mmap
+import os
 import queue
+import re
 import shutil
+import socket
+import stat
+import struct
 import subprocess
+import sys
+import tempfile
 import threading
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+try:
+    import orjson  # optional: faster (de)serialization, bytes in/out
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # optional: vectorized image packing
+except ImportError:
+    np = None
+
+try:
+    from hdrh.histogram import HdrHistogram  # optional: streaming latency percentiles
+except ImportError:
+    HdrHistogram = None
+
+try:
+    import msgspec  # optional: msgpack wire format for motor/cmd (--wire msgpack)
+except ImportError:
+    msgspec = None
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Compact like orjson (and the robot's encode_json), so the wire size does not
+    # depend on which encoder is installed.
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes | memoryview) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(str(raw, "utf-8"))
 
 
-def _apply_connect_overrides(cfg, mode: str, connect_endpoints: list[str]):
+def _now_ms() -> int:
+    # Wall-clock ms using integer arithmetic only.
+    return time.time_ns() // 1_000_000
+
+
+def _connect_overrides(mode: str, connect_endpoints: list[str]) -> tuple[tuple[str, str], ...]:
+    """(config key, JSON5 value) pairs for --mode/--connect, encoded once at startup.
+
+    Overrides apply only when endpoints are given; malformed endpoints are rejected
+    here rather than when the session opens.
+    """
+    if not connect_endpoints:
+        return ()
+    for endpoint in connect_endpoints:
+        proto, sep, addr = endpoint.partition("/")
+        if not sep or not proto or not addr:
+            raise SystemExit(f"invalid --connect endpoint (expected <proto>/<address>): {endpoint!r}")
+    overrides = []
     if mode:
-        cfg.insert_json5("mode", json.dumps(mode))
-    if connect_endpoints:
-        cfg.insert_json5("connect/endpoints", json.dumps(connect_endpoints))
-    return cfg
+        overrides.append(("mode", json.dumps(mode)))
+    overrides.append(("connect/endpoints", json.dumps(connect_endpoints)))
+    return tuple(overrides)
 
 
-def _build_session_opener(
-    *, config_path: Optional[Path], mode: str, connect_endpoints: list[str]
-):
-    import zenoh  # provided by `pip install eclipse-zenoh`
+def _apply_connect_overrides(cfg, overrides: tuple[tuple[str, str], ...]):
+    for key, value in overrides:
+        cfg.insert_json5(key, value)
+    return cfg
 
+
+def _build_session_opener(*, config_path: Optional[Path], overrides: tuple[tuple[str, str], ...]):
     if config_path is not None and not config_path.exists():
         raise SystemExit(
             f"zenoh config not found: {config_path}\n"
             "Create it (see doc/remote_pubsub/zenoh_remote_pubsub.md) or omit --zenoh-config to use defaults."
         )
+    # Keyed on the file's mtime so an edited config is parsed again.
+    mtime_ns = config_path.stat().st_mtime_ns if config_path is not None else 0
+    return _session_opener(config_path, mtime_ns, overrides)
 
-    if config_path:
-        cfg = zenoh.Config.from_file(str(config_path))
-    else:
-        try:
-            cfg = zenoh.Config.from_env()
-        except Exception:
-            cfg = zenoh.Config()
 
-    if connect_endpoints:
-        cfg = _apply_connect_overrides(cfg, mode, connect_endpoints)
+@functools.lru_cache(maxsize=8)
+def _session_opener(
+    config_path: Optional[Path], mtime_ns: int, overrides: tuple[tuple[str, str], ...]
+):
+    # One opener (and one up-front config parse) per distinct config; repeated main()
+    # calls in a process reuse it.
+    import zenoh  # provided by `pip install eclipse-zenoh`
+
+    def _make_config() -> Any:
+        if config_path:
+            cfg = zenoh.Config.from_file(str(config_path))
+        else:
+            try:
+                cfg = zenoh.Config.from_env()
+            except Exception:
+                cfg = zenoh.Config()
+
+        if overrides:
+            cfg = _apply_connect_overrides(cfg, overrides)
+        return cfg
+
+    # Built (and validated) up front for the first open. A reopen after the session
+    # was released gets a fresh config, so overrides are never applied twice to a
+    # config object zenoh has already used.
+    pending = [_make_config()]
+    memo_key = (str(config_path) if config_path else None, overrides, mtime_ns)
 
     def _opener() -> Any:
+        session = _SESSIONS.get(memo_key)
+        if session is not None:
+            return session
+        _close_stale_sessions(memo_key)
+        cfg = pending.pop() if pending else _make_config()
         try:
-            return zenoh.open(cfg)
+            session = zenoh.open(cfg)
         except Exception as e:
             raise SystemExit(f"failed to open zenoh session: {e}") from e
+        _SESSIONS[memo_key] = session
+        return session
 
     return _opener
 
 
+# Sessions are reused per (config_path, overrides, config mtime) and publishers per
+# key, so callers that run several commands in one process skip session setup and
+# re-declaration. A session opened from an older version of the config is closed
+# when the edited one is first opened; sessions holding cached publishers are closed
+# at exit.
+_SESSIONS: dict[tuple[Any, ...], Any] = {}
+_pub_cache: dict[tuple[int, str], Any] = {}
+
+
+def _get_publisher(session: Any, key: str) -> Any:
+    cache_key = (id(session), key)
+    pub = _pub_cache.get(cache_key)
+    if pub is None:
+        pub = _declare_publisher(session, key)
+        _pub_cache[cache_key] = pub
+    return pub
+
+
+def _release_session(session: Any) -> None:
+    # Keep sessions that own cached publishers; close one-shot (subscriber) sessions.
+    sid = id(session)
+    if isinstance(session, _DaemonSession):
+        # Only the socket is released; its publishers are cheap to rebuild.
+        for cache_key in [k for k in _pub_cache if k[0] == sid]:
+            del _pub_cache[cache_key]
+        session.close()
+        return
+    if any(cache_sid == sid for cache_sid, _ in _pub_cache):
+        return
+    for memo_key, cached in list(_SESSIONS.items()):
+        if cached is session:
+            del _SESSIONS[memo_key]
+    session.close()
+
+
+def _close_stale_sessions(memo_key: tuple[Any, ...]) -> None:
+    # Sessions opened from an older version of the same config file.
+    for stale_key, session in list(_SESSIONS.items()):
+        if stale_key[:2] != memo_key[:2] or stale_key == memo_key:
+            continue
+        del _SESSIONS[stale_key]
+        sid = id(session)
+        for cache_key in [k for k in _pub_cache if k[0] == sid]:
+            del _pub_cache[cache_key]
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+def _close_sessions() -> None:
+    _pub_cache.clear()
+    sessions = list(_SESSIONS.values())
+    _SESSIONS.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+atexit.register(_close_sessions)
+
+
+# daemon mode: one long-running process keeps the Zenoh session and publishers; the
+# publishing subcommands (motor/stop/oled/oled-image) hand their payloads to it over
+# a local SOCK_SEQPACKET socket instead of opening a session per invocation.
+# Each packet is [4-byte big-endian key length][key utf-8][payload]; no reply is sent.
+_DAEMON_CLIENT_CMDS = frozenset({"motor", "stop", "oled", "oled-image"})
+_DAEMON_MAX_PACKET = 1 << 20
+
+
+def _default_daemon_socket() -> Path:
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{uid}"
+    if os.path.isdir(runtime_dir):
+        return Path(runtime_dir) / "dmc_zenoh.sock"
+    # Shared temp dirs get a per-user 0700 subdirectory (created by `daemon`).
+    return Path(tempfile.gettempdir()) / f"dmc_zenoh-{uid}" / "dmc_zenoh.sock"
+
+
+def _socket_dir_is_private(path: Path) -> bool:
+    # Another user able to write the directory could swap in their own socket.
+    try:
+        st = os.lstat(path.parent)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode) or st.st_mode & 0o022:
+        return False
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+class _DaemonPublisher:
+    def __init__(self, session: "_DaemonSession", key: str) -> None:
+        self._session = session
+        self._send = session._sock.send
+        self._key = key
+        key_b = key.encode("utf-8")
+        self._header = _FRAME_HEADER.pack(len(key_b)) + key_b
+        self._direct: Any = None
+
+    def put(self, payload: bytes | memoryview) -> None:
+        if self._direct is None:
+            try:
+                self._send(self._header + bytes(payload))
+                return
+            except OSError as e:
+                # The daemon went away (EPIPE/ECONNRESET): publish directly from now on.
+                print(f"daemon unavailable ({e}); opening a Zenoh session directly")
+                self._direct = self._session.direct_publisher(self._key)
+        self._direct.put(payload)
+
+
+class _DaemonSession:
+    # Session stand-in whose publishers forward to a running `daemon`.
+    def __init__(self, sock: socket.socket, open_direct: Callable[[], Any]) -> None:
+        self._sock = sock
+        self._open_direct = open_direct
+
+    def declare_publisher(self, key: str, **_: Any) -> _DaemonPublisher:
+        # QoS is chosen by the daemon from the key (_declare_publisher).
+        return _DaemonPublisher(self, key)
+
+    def direct_publisher(self, key: str) -> Any:
+        # The direct session is memoized by the opener and closed at exit.
+        return _get_publisher(self._open_direct(), key)
+
+    def close(self) -> None:
+        self._sock.close()
+
+
+def _connect_daemon(path: Path, open_direct: Callable[[], Any]) -> Optional[_DaemonSession]:
+    if not path.exists() or not _socket_dir_is_private(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        # Stale socket file: fall back to a direct session.
+        sock.close()
+        return None
+    return _DaemonSession(sock, open_direct)
+
+
+def cmd_daemon(args: argparse.Namespace) -> int:
+    path = args.daemon_socket
+    if path == _default_daemon_socket():
+        path.parent.mkdir(mode=0o700, exist_ok=True)
+    if not _socket_dir_is_private(path):
+        raise SystemExit(f"{path.parent} must be a directory owned by you and not writable by others")
+    if _connect_daemon(path, args.open_session) is not None:
+        raise SystemExit(f"daemon already running on {path}")
+    if path.exists():
+        path.unlink()
+
+    session = args.open_session()
+    lock = threading.Lock()
+
+    def _publish(key: str, payload: bytes) -> None:
+        with lock:
+            pub = _get_publisher(session, key)
+        pub.put(payload)
+
+    def _serve(conn: socket.socket) -> None:
+        with conn:
+            while True:
+                try:
+                    packet = conn.recv(_DAEMON_MAX_PACKET)
+                except OSError:
+                    return
+                if not packet:
+                    return
+                try:
+                    (key_len,) = _FRAME_HEADER.unpack_from(packet)
+                    start = _FRAME_HEADER.size
+                    key = packet[start : start + key_len].decode("utf-8")
+                    if not key.startswith("dmc_robo/"):
+                        raise ValueError(f"unexpected key: {key!r}")
+                    _publish(key, packet[start + key_len :])
+                except Exception as e:
+                    print(f"daemon: dropped packet: {e}")
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    try:
+        server.bind(str(path))
+        os.chmod(path, 0o600)
+        server.listen()
+        print(f"daemon listening on {path} (Ctrl-C to quit)")
+        while True:
+            conn, _ = server.accept()
+            threading.Thread(target=_serve, args=(conn,), daemon=True).start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    return 0
+
+
+# Same rule as the robot side (dmc_ai_mobility.zenoh.keys): non-empty, no "/".
+_ROBOT_ID_RE = re.compile(r"[^/]+")
+
+
+@functools.lru_cache(maxsize=64)
 def _key(robot_id: str, suffix: str) -> str:
-    if not robot_id or "/" in robot_id:
+    # Validated and formatted once per (robot_id, suffix); later calls (e.g. per daemon
+    # request or repeated commands in one process) are a cache hit.
+    if not _ROBOT_ID_RE.fullmatch(robot_id):
         raise SystemExit("robot_id must be non-empty and must not contain '/'")
     return f"dmc_robo/{robot_id}/{suffix}"
 
 
+def _declare_publisher(session: Any, key: str) -> Any:
+    # Per-topic QoS: see the module docstring.
+    if isinstance(session, _DaemonSession):
+        return session.declare_publisher(key)
+    import zenoh
+
+    suffix = key.split("/", 2)[-1]
+    if suffix == "motor/cmd":
+        return session.declare_publisher(
+            key,
+            congestion_control=zenoh.CongestionControl.DROP,
+            priority=zenoh.Priority.REAL_TIME,
+            express=True,
+        )
+    if suffix.startswith("camera/"):
+        return session.declare_publisher(key, priority=zenoh.Priority.DATA_HIGH)
+    if suffix.startswith("oled/"):
+        return session.declare_publisher(key, priority=zenoh.Priority.DATA_LOW)
+    return session.declare_publisher(key)
+
+
+class _DrainedSubscriber:
+    # A channel-backed subscriber plus the thread draining it; undeclare() stops both.
+    def __init__(self, sub: Any, thread: threading.Thread) -> None:
+        self._sub = sub
+        self._thread = thread
+
+    def undeclare(self) -> None:
+        self._sub.undeclare()
+        self._thread.join(timeout=1.0)
+
+
+def _declare_drained_subscriber(session: Any, key: str, handler: Any, capacity: int = 1024) -> Any:
+    """Subscribe ``key`` into a bounded FIFO channel drained by a dedicated thread.
+
+    Zenoh fills the channel without calling into Python per sample, and ``handler``
+    runs on the drain thread. Falls back to a plain callback subscriber on Zenoh
+    versions without ``zenoh.handlers``.
+    """
+    import zenoh
+
+    handlers = getattr(zenoh, "handlers", None)
+    if handlers is None or not hasattr(handlers, "FifoChannel"):
+        return session.declare_subscriber(key, handler)
+
+    sub = session.declare_subscriber(key, handlers.FifoChannel(capacity))
+
+    def _drain() -> None:
+        # Iteration ends once the subscriber is undeclared.
+        for sample in sub:
+            try:
+                handler(sample)
+            except Exception as e:
+                print(f"handler failed: {e}")
+
+    thread = threading.Thread(target=_drain, name=f"drain:{key}", daemon=True)
+    thread.start()
+    return _DrainedSubscriber(sub, thread)
+
+
+# motor/cmd payloads: the static fields are serialized once into a template and only
+# seq/ts_ms are formatted in per message.
+_MOTOR_PAYLOAD_TAIL = b',"seq":%d,"ts_ms":%d}'
+
+
+def _motor_payload_prefix(v_l: float, v_r: float, unit: str, deadman_ms: int) -> bytes:
+    # Serialized static fields without the closing brace.
+    return _dumps({"v_l": v_l, "v_r": v_r, "unit": unit, "deadman_ms": deadman_ms})[:-1]
+
+
+if msgspec is not None:
+
+    class MotorCmd(msgspec.Struct):
+        # Field names match the JSON schema; encoded as a msgpack map so the robot
+        # can tell it apart from JSON by the first byte.
+        v_l: float
+        v_r: float
+        unit: str = "mps"
+        deadman_ms: int = 300
+        seq: int = 0
+        ts_ms: int = 0
+
+    _MSGPACK_ENC = msgspec.msgpack.Encoder()
+
+
+def _motor_payload_fn(wire: str, v_l: float, v_r: float, unit: str, deadman_ms: int):
+    """Return ``fn(seq, ts_ms) -> bytes`` producing motor/cmd payloads in ``wire`` format."""
+    if wire == "msgpack":
+        if msgspec is None:
+            raise SystemExit("--wire msgpack requires msgspec (pip install msgspec)")
+        cmd = MotorCmd(v_l=v_l, v_r=v_r, unit=unit, deadman_ms=deadman_ms)
+        encode = _MSGPACK_ENC.encode
+
+        def _msgpack_payload(seq: int, ts_ms: int) -> bytes:
+            cmd.seq = seq
+            cmd.ts_ms = ts_ms
+            return encode(cmd)
+
+        return _msgpack_payload
+
+    # Escape "%" so a user-supplied unit cannot break the format template.
+    template = _motor_payload_prefix(v_l, v_r, unit, deadman_ms).replace(b"%", b"%%") + _MOTOR_PAYLOAD_TAIL
+
+    def _json_payload(seq: int, ts_ms: int) -> bytes:
+        return template % (seq, ts_ms)
+
+    return _json_payload
+
+
+# --batch framing: [4-byte big-endian length][payload] per command, concatenated.
+# The robot detects it by the leading 0x00 and applies the commands in order.
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def _encode_frames(payloads: list[bytes]) -> bytes:
+    pack = _FRAME_HEADER.pack
+    return b"".join(pack(len(p)) + p for p in payloads)
+
+
 def cmd_motor(args: argparse.Namespace) -> int:
+    interval_s = 1.0 / args.hz if args.hz > 0 else 0.05
+    batch = args.batch
+    if batch < 1:
+        raise SystemExit("--batch must be >= 1")
+    if batch > 1 and batch * interval_s * 1000.0 >= args.deadman_ms:
+        raise SystemExit(
+            f"--batch {batch} at {1.0 / interval_s:g} Hz delays commands by >= --deadman-ms {args.deadman_ms}"
+        )
+
     key = _key(args.robot_id, "motor/cmd")
     session = args.open_session()
-    pub = session.declare_publisher(key)
+    pub = _get_publisher(session, key)
 
-    interval_s = 1.0 / args.hz if args.hz > 0 else 0.05
-    end_t = time.monotonic() + args.duration_s
+    # Integer nanosecond deadlines: no float accumulation error over long runs.
+    interval_ns = round(interval_s * 1e9)
+    next_ns = time.monotonic_ns()
+    end_ns = next_ns + round(args.duration_s * 1e9)
     seq = 0
 
+    payload = _motor_payload_fn(args.wire, args.v_l, args.v_r, args.unit, args.deadman_ms)
+    pending: list[bytes] = []
+
+    # Loop-invariant callables bound to locals (fast local loads in the hot loop).
+    put = pub.put
+    now_ms = _now_ms
+    mono_ns = time.monotonic_ns
+    sleep = time.sleep
+    append = pending.append
+
     try:
-        while time.monotonic() < end_t:
-            payload = {
-                "v_l": args.v_l,
-                "v_r": args.v_r,
-                "unit": args.unit,
-                "deadman_ms": args.deadman_ms,
-                "seq": seq,
-                "ts_ms": int(time.time() * 1000),
-            }
-            pub.put(json.dumps(payload).encode("utf-8"))
+        # Absolute deadlines: publish cost does not accumulate as drift. If we fall
+        # behind, the schedule is re-anchored instead of bursting to catch up.
+        while next_ns < end_ns:
+            if batch == 1:
+                put(payload(seq, now_ms()))
+            else:
+                append(payload(seq, now_ms()))
+                if len(pending) >= batch:
+                    put(_encode_frames(pending))
+                    pending.clear()
             seq += 1
-            time.sleep(interval_s)
+            next_ns += interval_ns
+            delay_ns = next_ns - mono_ns()
+            if delay_ns > 0:
+                sleep(delay_ns / 1e9)
+            else:
+                next_ns = mono_ns()
+        if pending:
+            put(_encode_frames(pending))
     finally:
-        session.close()
+        _release_session(session)
     return 0
 
 
 def cmd_stop(args: argparse.Namespace) -> int:
     key = _key(args.robot_id, "motor/cmd")
+    # The zero-velocity template is built before the session is opened, so the stop
+    # path does no encoding work (or late --wire errors) once it can publish.
+    payload = _motor_payload_fn(args.wire, 0.0, 0.0, args.unit, args.deadman_ms)
     session = args.open_session()
-    pub = session.declare_publisher(key)
+    pub = _get_publisher(session, key)
 
+    interval_ns = 50_000_000
+    last = args.count - 1
+    next_ns = time.monotonic_ns()
     try:
         for i in range(args.count):
-            payload = {
-                "v_l": 0.0,
-                "v_r": 0.0,
-                "unit": args.unit,
-                "deadman_ms": args.deadman_ms,
-                "seq": i,
-                "ts_ms": int(time.time() * 1000),
-            }
-            pub.put(json.dumps(payload).encode("utf-8"))
-            time.sleep(0.05)
+            pub.put(payload(i, _now_ms()))
+            if i == last:
+                # No pacing delay after the final command.
+                break
+            next_ns += interval_ns
+            delay_ns = next_ns - time.monotonic_ns()
+            if delay_ns > 0:
+                time.sleep(delay_ns / 1e9)
+            else:
+                next_ns = time.monotonic_ns()
     finally:
-        session.close()
+        _release_session(session)
     return 0
 
 
 def cmd_oled(args: argparse.Namespace) -> int:
     key = _key(args.robot_id, "oled/cmd")
     session = args.open_session()
-    pub = session.declare_publisher(key)
+    pub = _get_publisher(session, key)
     try:
-        payload = {"text": args.text, "ts_ms": int(time.time() * 1000)}
-        pub.put(json.dumps(payload).encode("utf-8"))
+        payload = {"text": args.text, "ts_ms": _now_ms()}
+        pub.put(_dumps(payload))
         time.sleep(0.1)
     finally:
-        session.close()
+        _release_session(session)
     return 0
 
 
@@ -133,7 +593,15 @@ def _mono1_buf_len(width: int, height: int) -> int:
     return (width * height) // 8
 
 
-def _image_path_to_mono1(path: Path, *, width: int, height: int, invert: bool) -> bytes:
+def _image_path_to_mono1_view(
+    path: Path, *, width: int, height: int, invert: bool, out: Optional[bytearray] = None
+) -> memoryview:
+    """Convert an image to SSD1306 mono1 bytes written into ``out``.
+
+    Returns a view of ``out`` (zero-copy hand-off to ``pub.put``). Callers converting
+    many frames (e.g. animation) should keep ``out`` and pass it back on each call so
+    the buffer is reused instead of reallocated.
+    """
     try:
         from PIL import Image, ImageOps  # type: ignore
     except Exception as e:
@@ -146,22 +614,41 @@ def _image_path_to_mono1(path: Path, *, width: int, height: int, invert: bool) -
     img = img.convert("1")
 
     expected = _mono1_buf_len(width, height)
-    buf = bytearray(expected)
-    px = img.load()
+    if out is None or len(out) != expected:
+        out = bytearray(expected)
+
+    if np is not None:
+        # SSD1306 page layout: each byte is 8 vertical pixels (LSB = top row of the page).
+        bits = (np.asarray(img, dtype=np.uint8) > 0).astype(np.uint8)
+        packed = np.packbits(bits.reshape(height // 8, 8, width), axis=1, bitorder="little")
+        np.frombuffer(out, dtype=np.uint8)[:] = packed.reshape(-1)
+        return memoryview(out)
+
+    # The fallback ORs bits in, so a reused buffer has to be cleared first.
+    out[:] = bytes(expected)
+    # PIL mode "1" tobytes(): rows of ceil(width/8) bytes, MSB = leftmost pixel.
+    raw = img.tobytes()
+    row_stride = (width + 7) // 8
     for y in range(height):
-        page = y // 8
-        bit = y % 8
-        base = page * width
+        row = raw[y * row_stride : (y + 1) * row_stride]
+        base = (y >> 3) * width
+        mask = 1 << (y & 7)
         for x in range(width):
-            if px[x, y]:
-                buf[base + x] |= 1 << bit
-    return bytes(buf)
+            if row[x >> 3] & (0x80 >> (x & 7)):
+                out[base + x] |= mask
+    return memoryview(out)
+
+
+def _image_path_to_mono1(
+    path: Path, *, width: int, height: int, invert: bool, out: Optional[bytearray] = None
+) -> bytes:
+    return bytes(_image_path_to_mono1_view(path, width=width, height=height, invert=invert, out=out))
 
 
 def cmd_oled_image_mono1(args: argparse.Namespace) -> int:
     key = _key(args.robot_id, "oled/image/mono1")
     session = args.open_session()
-    pub = session.declare_publisher(key)
+    pub = _get_publisher(session, key)
 
     width = int(args.width)
     height = int(args.height)
@@ -179,13 +666,127 @@ def cmd_oled_image_mono1(args: argparse.Namespace) -> int:
         pub.put(payload)
         time.sleep(0.1)
     finally:
-        session.close()
+        _release_session(session)
     return 0
 
 
+def _payload_view(sample: Any) -> bytes | memoryview:
+    # Zero-copy view of the payload when it supports the buffer protocol.
+    payload = sample.payload
+    try:
+        return memoryview(payload)
+    except TypeError:
+        return payload.to_bytes()
+
+
 def _decode_json_payload(sample: Any) -> Any:
-    raw = sample.payload.to_bytes()
-    return json.loads(raw.decode("utf-8"))
+    return _loads(_payload_view(sample))
+
+
+class _LineSink:
+    """Batched stdout for per-sample output lines.
+
+    Whole lines are appended to a buffer under a lock (so lines from different
+    subscriber threads never interleave) and written with one os.write per flush:
+    ``interval_s`` after the first pending line, or immediately past ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024, interval_s: float = 0.01) -> None:
+        self._max_bytes = max_bytes
+        self._interval_s = interval_s
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Set once the flush thread has died; write() then flushes inline.
+        self._direct = False
+
+    def write(self, *parts: bytes | memoryview) -> None:
+        with self._lock:
+            for part in parts:
+                self._buf += part
+            size = len(self._buf)
+            direct = self._direct
+            if self._thread is None and not direct:
+                self._thread = threading.Thread(target=self._run, name="stdout-sink", daemon=True)
+                self._thread.start()
+        if direct or size >= self._max_bytes:
+            self.flush()
+        else:
+            self._pending.set()
+
+    def write_line(self, text: str) -> None:
+        self.write(text.encode("utf-8"), b"\n")
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                if not self._buf:
+                    return
+                data, self._buf = self._buf, bytearray()
+                self._pending.clear()
+            sys.stdout.flush()  # keep ordering with text-mode print()
+            try:
+                fd = sys.stdout.fileno()
+            except (AttributeError, OSError, ValueError):
+                sys.stdout.write(data.decode("utf-8", errors="replace"))
+                sys.stdout.flush()
+                return
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+
+    def _run(self) -> None:
+        while True:
+            self._pending.wait()
+            time.sleep(self._interval_s)
+            try:
+                self.flush()
+            except OSError:
+                # e.g. a closed stdout pipe: stop batching so later writes are not left
+                # queued behind a dead thread.
+                with self._lock:
+                    self._thread = None
+                    self._direct = True
+                return
+
+
+_SINK = _LineSink()
+atexit.register(_SINK.flush)
+
+
+def _write_payload_line(sample: Any, prefix: bytes = b"") -> None:
+    # Print a JSON payload as published (already UTF-8 JSON from the robot) without a
+    # decode/re-encode round trip.
+    _SINK.write(prefix, _payload_view(sample), b"\n")
+
+
+def _extract_int(raw: bytes, key: bytes) -> int | None:
+    # Integer value of the first b'"<key>"' in a JSON object, without a full parse.
+    # Only valid for keys that do not also appear in nested values.
+    quoted = b'"' + key + b'"'
+    i = raw.find(quoted)
+    if i < 0:
+        return None
+    j = raw.find(b":", i + len(quoted))
+    if j < 0:
+        return None
+    k = j + 1
+    n = len(raw)
+    while k < n and raw[k] in b" \t":
+        k += 1
+    m = k
+    while m < n and raw[m] in b"0123456789-":
+        m += 1
+    try:
+        return int(raw[k:m])
+    except ValueError:
+        return None
+
+
+def _extract_seq(raw: bytes) -> int | None:
+    return _extract_int(raw, b"seq")
 
 
 def _percentile(sorted_vals: list[float], pct: float) -> float:
@@ -199,9 +800,24 @@ def _percentile(sorted_vals: list[float], pct: float) -> float:
     return float(sorted_vals[f]) + (float(sorted_vals[c]) - float(sorted_vals[f])) * (k - f)
 
 
+# Below this size the pure-Python path is as fast as the NumPy round-trip.
+_SUMMARY_NUMPY_MIN = 64
+
+
 def _summarize(values: list[float]) -> dict[str, float]:
     if not values:
         return {}
+    if np is not None and len(values) >= _SUMMARY_NUMPY_MIN:
+        arr = np.fromiter((float(v) for v in values), dtype=np.float64, count=len(values))
+        p50, p95 = np.percentile(arr, [50, 95])
+        return {
+            "count": float(arr.size),
+            "min": float(arr.min()),
+            "avg": float(arr.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "max": float(arr.max()),
+        }
     vals = sorted(float(v) for v in values)
     avg = sum(vals) / len(vals)
     return {
@@ -214,8 +830,65 @@ def _summarize(values: list[float]) -> dict[str, float]:
     }
 
 
-def _print_summary(label: str, values: list[float]) -> None:
-    stats = _summarize(values)
+# camera-latency histograms record microseconds (1us..60s, 3 significant digits).
+_HIST_MAX_US = 60_000_000
+
+
+def _summarize_hist(hist: Any, extra: list[float]) -> dict[str, float]:
+    count = hist.get_total_count()
+    if not extra:
+        if count == 0:
+            return {}
+        return {
+            "count": float(count),
+            "min": hist.get_min_value() / 1000.0,
+            "avg": hist.get_mean_value() / 1000.0,
+            "p50": hist.get_value_at_percentile(50) / 1000.0,
+            "p95": hist.get_value_at_percentile(95) / 1000.0,
+            "max": hist.get_max_value() / 1000.0,
+        }
+
+    # Samples the histogram cannot hold (negative clock skew, > 60 s) were kept raw;
+    # merge them with the recorded buckets so the result matches _summarize().
+    bins = [(it.value_iterated_to / 1000.0, it.count_added_in_this_iter_step) for it in hist.get_recorded_iterator()]
+    bins.extend((float(v), 1) for v in extra)
+    bins.sort()
+    total = count + len(extra)
+    lo = min(extra)
+    hi = max(extra)
+    if count:
+        lo = min(lo, hist.get_min_value() / 1000.0)
+        hi = max(hi, hist.get_max_value() / 1000.0)
+    return {
+        "count": float(total),
+        "min": float(lo),
+        "avg": (hist.get_mean_value() / 1000.0 * count + sum(extra)) / total,
+        "p50": _binned_percentile(bins, total, 50),
+        "p95": _binned_percentile(bins, total, 95),
+        "max": float(hi),
+    }
+
+
+def _binned_percentile(bins: list[tuple[float, int]], total: int, pct: float) -> float:
+    # Same interpolation as _percentile(), over sorted (value, count) pairs.
+    k = (total - 1) * (pct / 100.0)
+    f = math.floor(k)
+    c = math.ceil(k)
+    lo_v = hi_v = None
+    seen = 0
+    for value, n in bins:
+        seen += n
+        if lo_v is None and seen > f:
+            lo_v = value
+        if seen > c:
+            hi_v = value
+            break
+    if lo_v is None or hi_v is None:
+        lo_v = hi_v = bins[-1][0]
+    return float(lo_v) + (float(hi_v) - float(lo_v)) * (k - f)
+
+
+def _print_stats(label: str, stats: dict[str, float]) -> None:
     if not stats:
         print(f"{label}: no samples")
         return
@@ -225,6 +898,10 @@ def _print_summary(label: str, values: list[float]) -> None:
     )
 
 
+def _print_summary(label: str, values: list[float]) -> None:
+    _print_stats(label, _summarize(values))
+
+
 def _to_int(value: Any) -> int | None:
     try:
         return int(value)
@@ -249,41 +926,43 @@ def _plot_latency(samples: list[dict[str, Any]], *, title: str | None, out_path:
         print("no samples to plot")
         return
 
-    xs: list[float] = []
-    read_ms: list[float] = []
-    pipeline: list[float] = []
-    start_to_publish: list[float] = []
-    publish_to_remote: list[float] = []
+    # matplotlib depends on NumPy, so np is always available here.
+    xs_a: list[float] = []
+    read_a: list[float] = []
+    pipe_a: list[float] = []
+    stp_a: list[float] = []
+    p2r_a: list[float] = []
+    nan = math.nan
     for idx, sample in enumerate(samples):
-        seq = sample.get("seq")
-        xs.append(float(seq) if seq is not None else float(idx))
-        read_val = sample.get("read_ms")
-        pipeline_val = sample.get("pipeline_ms")
-        start_to_publish_val = sample.get("start_to_publish_ms")
-        publish_to_remote_val = sample.get("publish_to_remote_ms")
-        read_num = float(read_val) if read_val is not None else math.nan
-        pipeline_num = float(pipeline_val) if pipeline_val is not None else math.nan
-        start_num = float(start_to_publish_val) if start_to_publish_val is not None else math.nan
-        publish_remote_num = (
-            float(publish_to_remote_val) if publish_to_remote_val is not None else math.nan
-        )
-        read_ms.append(read_num)
-        pipeline.append(pipeline_num)
-        start_to_publish.append(start_num)
-        publish_to_remote.append(publish_remote_num)
+        get = sample.get
+        seq = get("seq")
+        xs_a.append(float(seq) if seq is not None else float(idx))
+        v = get("read_ms")
+        read_a.append(float(v) if v is not None else nan)
+        v = get("pipeline_ms")
+        pipe_a.append(float(v) if v is not None else nan)
+        v = get("start_to_publish_ms")
+        stp_a.append(float(v) if v is not None else nan)
+        v = get("publish_to_remote_ms")
+        p2r_a.append(float(v) if v is not None else nan)
+    xs = np.array(xs_a, dtype=np.float64)
+    read_ms = np.array(read_a, dtype=np.float64)
+    pipeline = np.array(pipe_a, dtype=np.float64)
+    start_to_publish = np.array(stp_a, dtype=np.float64)
+    publish_to_remote = np.array(p2r_a, dtype=np.float64)
 
     fig, ax = plt.subplots()
-    stack_read = [0.0 if math.isnan(v) else v for v in read_ms]
-    stack_pipeline = [0.0 if math.isnan(v) else v for v in pipeline]
-    stack_publish_remote = [0.0 if math.isnan(v) else v for v in publish_to_remote]
+    stack_read = np.nan_to_num(read_ms, nan=0.0)
+    stack_pipeline = np.nan_to_num(pipeline, nan=0.0)
+    stack_publish_remote = np.nan_to_num(publish_to_remote, nan=0.0)
     series = [stack_read, stack_pipeline]
     labels = ["read_ms", "pipeline_ms"]
-    if any(v > 0 for v in stack_publish_remote):
+    if np.any(stack_publish_remote > 0):
         series.append(stack_publish_remote)
         labels.append("publish_to_remote_ms")
-    if any(v > 0 for v in stack_read) or any(v > 0 for v in stack_pipeline) or any(v > 0 for v in stack_publish_remote):
+    if np.any(stack_read > 0) or np.any(stack_pipeline > 0) or np.any(stack_publish_remote > 0):
         ax.stackplot(xs, series, labels=labels, alpha=0.5)
-    if any(not math.isnan(v) for v in start_to_publish):
+    if not np.all(np.isnan(start_to_publish)):
         ax.plot(xs, start_to_publish, label="start_to_publish_ms", color="black", linewidth=1.2)
     ax.set_xlabel("seq")
     ax.set_ylabel("ms")
@@ -304,17 +983,14 @@ def cmd_imu(args: argparse.Namespace) -> int:
     session = args.open_session()
 
     def on_sample(sample: Any) -> None:
-        try:
-            print(json.dumps(_decode_json_payload(sample), ensure_ascii=False))
-        except Exception as e:
-            print(f"decode failed: {e}")
+        _write_payload_line(sample)
 
-    sub = session.declare_subscriber(key, on_sample)
+    sub = _declare_drained_subscriber(session, key, on_sample)
     try:
         input("subscribing imu... press Enter to quit\n")
     finally:
         sub.undeclare()
-        session.close()
+        _release_session(session)
     return 0
 
 
@@ -323,54 +999,220 @@ def cmd_motor_telemetry(args: argparse.Namespace) -> int:
     session = args.open_session()
 
     def on_sample(sample: Any) -> None:
-        try:
-            print(json.dumps(_decode_json_payload(sample), ensure_ascii=False))
-        except Exception as e:
-            print(f"decode failed: {e}")
+        _write_payload_line(sample)
 
-    sub = session.declare_subscriber(key, on_sample)
+    sub = _declare_drained_subscriber(session, key, on_sample)
     try:
         input("subscribing motor telemetry... press Enter to quit\n")
     finally:
         sub.undeclare()
-        session.close()
+        _release_session(session)
     return 0
 
 
+class _MmapRing:
+    """Fixed-size frame archive written through a shared memory map.
+
+    Layout: [8-byte big-endian head][8-byte big-endian tail][records...], each record
+    being [4-byte big-endian length][data]. head is the end of the newest record and
+    tail the start of the oldest intact one; a reader walks from tail to head. A zero
+    length, or fewer than 4 bytes left before the end of the file, means "continue at
+    the first record", so empty frames are rejected. Single writer.
+    """
+
+    _HEAD = struct.Struct(">QQ")
+
+    def __init__(self, path: str, size: int) -> None:
+        if size < self._HEAD.size + _FRAME_HEADER.size + 1:
+            raise ValueError(f"ring of {size} bytes is too small")
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            # MAP_POPULATE (Linux) pre-faults the pages so frame copies do not fault.
+            flags = mmap.MAP_SHARED | getattr(mmap, "MAP_POPULATE", 0)
+            self._mm = mmap.mmap(fd, size, flags=flags)
+        finally:
+            os.close(fd)
+        self._size = size
+        self._pos = self._HEAD.size
+        # (start, end) of the live records, oldest first.
+        self._live: "collections.deque[tuple[int, int]]" = collections.deque()
+        self._HEAD.pack_into(self._mm, 0, self._pos, self._pos)
+
+    def append(self, data: bytes | memoryview) -> int:
+        n = len(data)
+        if n == 0:
+            # A zero length is the wrap marker, so it cannot be stored as a record.
+            raise ValueError("empty frame")
+        need = _FRAME_HEADER.size + n
+        first = self._HEAD.size
+        if need > self._size - first:
+            raise ValueError(f"frame of {n} bytes does not fit the ring")
+        live = self._live
+        pos = self._pos
+        if pos + need > self._size:
+            # Everything between pos and the end of the file is about to be skipped.
+            while live and live[0][0] >= pos:
+                live.popleft()
+            if self._size - pos >= _FRAME_HEADER.size:
+                _FRAME_HEADER.pack_into(self._mm, pos, 0)
+            pos = first
+        # Drop the oldest records this one overwrites (they start right after pos). One
+        # starting exactly at the new end goes too: head == tail must mean "empty".
+        end = pos + need
+        while live and pos <= live[0][0] <= end:
+            live.popleft()
+        # Publish the new tail before overwriting, so a reader never follows a record
+        # that is being replaced.
+        tail = live[0][0] if live else pos
+        self._HEAD.pack_into(self._mm, 0, self._pos, tail)
+        _FRAME_HEADER.pack_into(self._mm, pos, n)
+        # Single copy from the payload buffer into the mapped page cache.
+        self._mm[pos + _FRAME_HEADER.size : end] = data
+        live.append((pos, end))
+        self._pos = end
+        self._HEAD.pack_into(self._mm, 0, end, tail)
+        return n
+
+    @classmethod
+    def records(cls, buf: bytes | memoryview) -> "list[memoryview]":
+        """Return the frames stored in a ring file's contents, oldest first."""
+        view = memoryview(buf)
+        head, pos = cls._HEAD.unpack_from(view, 0)
+        out: list[memoryview] = []
+        first = cls._HEAD.size
+        while pos != head:
+            if len(view) - pos < _FRAME_HEADER.size:
+                pos = first
+                continue
+            (n,) = _FRAME_HEADER.unpack_from(view, pos)
+            if n == 0:
+                pos = first
+                continue
+            start = pos + _FRAME_HEADER.size
+            out.append(view[start : start + n])
+            pos = start + n
+        return out
+
+    def close(self) -> None:
+        self._mm.close()
+
+
 def cmd_camera(args: argparse.Namespace) -> int:
     key_img = _key(args.robot_id, "camera/image/jpeg")
     key_meta = _key(args.robot_id, "camera/meta")
-    session = args.open_session()
 
     out_dir = args.out_dir
-    out_dir.mkdir(parents=True, exist_ok=True)
+    concat_fd: Optional[int] = None
+    ring: Optional[_MmapRing] = None
+    # Output is validated and opened before the session, so bad options fail fast.
+    if args.concat_ring_mb:
+        if args.concat_out is None:
+            raise SystemExit("--concat-ring-mb requires --concat-out")
+        if not math.isfinite(args.concat_ring_mb) or args.concat_ring_mb <= 0:
+            raise SystemExit("--concat-ring-mb must be a positive number of MiB")
+        try:
+            ring = _MmapRing(args.concat_out, int(args.concat_ring_mb * 1024 * 1024))
+        except ValueError as e:
+            raise SystemExit(f"--concat-ring-mb: {e}") from e
+    elif args.concat_out is not None:
+        # One pre-opened append-only file of [4-byte big-endian length][jpeg] records.
+        concat_fd = os.open(args.concat_out, os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC, 0o644)
+    else:
+        out_dir.mkdir(parents=True, exist_ok=True)
+    session = args.open_session()
 
     state: dict[str, Any] = {"seq": None}
 
     def on_meta(sample: Any) -> None:
+        # Only seq is needed: scan the raw bytes instead of parsing the JSON.
+        state["seq"] = _extract_seq(sample.payload.to_bytes())
+        if args.print_meta:
+            _write_payload_line(sample, b"meta: ")
+
+    # Frame paths are bytes built from a precomputed prefix on the writer thread; the
+    # callback only hands over the frame id (no Path or str formatting per frame).
+    path_prefix = os.fsencode(str(out_dir)) + b"/frame_"
+
+    def _write_all(fd: int, data: bytes | memoryview) -> int:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        return len(data)
+
+    def _write_bytes(path: bytes, data: bytes | memoryview) -> int:
+        # Raw fd I/O: no Python file object or buffer per frame.
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
         try:
-            meta = _decode_json_payload(sample)
-            state["seq"] = meta.get("seq")
-            if args.print_meta:
-                print("meta:", json.dumps(meta, ensure_ascii=False))
-        except Exception:
-            return
+            return _write_all(fd, data)
+        finally:
+            os.close(fd)
+
+    def _append_record(fd: int, data: bytes | memoryview) -> int:
+        header = _FRAME_HEADER.pack(len(data))
+        n = os.writev(fd, [header, data])
+        if n < len(header) + len(data):
+            # Short scatter write: finish the record so the file stays parseable.
+            rest = memoryview(header + bytes(data))[n:]
+            _write_all(fd, rest)
+        return len(data)
+
+    # Disk writes run on a writer thread so the Zenoh callback returns immediately.
+    # When the writer falls behind, new frames are dropped instead of queued.
+    frames: "queue.Queue[Optional[tuple[int, bytes | memoryview]]]" = queue.Queue(maxsize=16)
+
+    def _writer() -> None:
+        while True:
+            item = frames.get()
+            if item is None:
+                return
+            frame_id, jpg = item
+            # Named before the write so a failure reports this frame, not the last one.
+            if ring is not None or concat_fd is not None:
+                name = f"{args.concat_out} <- frame_{frame_id}.jpg"
+            else:
+                path = path_prefix + b"%d.jpg" % frame_id
+                name = os.fsdecode(path)
+            try:
+                if ring is not None:
+                    n = ring.append(jpg)
+                elif concat_fd is not None:
+                    n = _append_record(concat_fd, jpg)
+                else:
+                    n = _write_bytes(path, jpg)
+            except (OSError, ValueError) as e:
+                print(f"write failed: {name}: {e}")
+                continue
+            _SINK.write_line(f"saved: {name} ({n} bytes)")
+
+    writer = threading.Thread(target=_writer, daemon=True)
+    writer.start()
 
     def on_img(sample: Any) -> None:
-        jpg = sample.payload.to_bytes()
-        seq = state.get("seq")
-        name = out_dir / f"frame_{seq if seq is not None else int(time.time()*1000)}.jpg"
-        name.write_bytes(jpg)
-        print(f"saved: {name} ({len(jpg)} bytes)")
+        # The view keeps the payload alive until the writer is done with it, so the
+        # JPEG is not copied into a temporary bytes object (nor for dropped frames).
+        jpg = _payload_view(sample)
+        seq = state["seq"]
+        try:
+            frames.put_nowait((seq if seq is not None else _now_ms(), jpg))
+        except queue.Full:
+            pass
 
-    sub_meta = session.declare_subscriber(key_meta, on_meta)
-    sub_img = session.declare_subscriber(key_img, on_img)
+    sub_meta = _declare_drained_subscriber(session, key_meta, on_meta)
+    sub_img = _declare_drained_subscriber(session, key_img, on_img)
     try:
         input("subscribing camera... press Enter to quit\n")
     finally:
         sub_img.undeclare()
         sub_meta.undeclare()
-        session.close()
+        _release_session(session)
+        frames.put(None)
+        writer.join(timeout=2.0)
+        if not writer.is_alive():
+            if concat_fd is not None:
+                os.close(concat_fd)
+            if ring is not None:
+                ring.close()
     return 0
 
 
@@ -378,18 +1220,32 @@ def cmd_camera_latency(args: argparse.Namespace) -> int:
     key_meta = _key(args.robot_id, "camera/meta")
     session = args.open_session()
 
-    samples: list[dict[str, Any]] = []
-    lock = threading.Lock()
+    # With hdrh installed, stats are streamed into fixed-size histograms and per-sample
+    # entries are kept only when a plot needs them.
+    fields = ("read_ms", "pipeline_ms", "start_to_publish_ms", "publish_to_remote_ms")
+    hists: Optional[dict[str, Any]] = None
+    if HdrHistogram is not None:
+        hists = {name: HdrHistogram(1, _HIST_MAX_US, 3) for name in fields}
+    # Values outside the histogram range, summarized together with it at the end.
+    out_of_range: dict[str, list[float]] = {name: [] for name in fields}
+    keep_samples = hists is None or bool(args.plot or args.plot_out)
+
+    # deque.append is atomic under the GIL, so the callback needs no lock; with
+    # --max-samples the deque also caps memory.
+    max_samples = args.max_samples if args.max_samples > 0 else None
+    samples: "collections.deque[dict[str, Any]]" = collections.deque(maxlen=max_samples)
+    sample_count = 0
     stop_event = threading.Event()
 
     def on_meta(sample: Any) -> None:
+        nonlocal sample_count
         try:
             meta = _decode_json_payload(sample)
         except Exception:
             return
 
         # 受信時刻（publish->remote の推定に使用）
-        recv_ts_ms = int(time.time() * 1000)
+        recv_ts_ms = _now_ms()
         capture_ts_ms = _to_int(meta.get("capture_ts_ms"))
         publish_ts_ms = _to_int(meta.get("publish_ts_ms"))
         capture_start_mono_ms = _to_int(meta.get("capture_start_mono_ms"))
@@ -416,18 +1272,29 @@ def cmd_camera_latency(args: argparse.Namespace) -> int:
             "start_to_publish_ms": start_to_publish_ms,
         }
 
-        with lock:
+        if hists is not None:
+            for name in fields:
+                value = entry[name]
+                if value is None:
+                    continue
+                value_us = int(value * 1000.0)
+                # Negative values (e.g. clock skew on publish_to_remote_ms) cannot be recorded.
+                if 0 <= value_us <= _HIST_MAX_US:
+                    hists[name].record_value(value_us)
+                else:
+                    out_of_range[name].append(value)
+        if keep_samples:
             samples.append(entry)
-            sample_count = len(samples)
 
         if args.print_each:
-            print(
-                "seq={seq} read_ms={read_ms} pipeline_ms={pipeline_ms} "
-                "start_to_publish_ms={start_to_publish_ms} publish_to_remote_ms={publish_to_remote_ms} "
-                "publish_ts_ms={publish_ts_ms} recv_ts_ms={recv_ts_ms}".format(**entry)
+            _SINK.write_line(
+                f"seq={entry['seq']} read_ms={read_ms} pipeline_ms={pipeline_ms} "
+                f"start_to_publish_ms={start_to_publish_ms} publish_to_remote_ms={publish_to_remote_ms} "
+                f"publish_ts_ms={publish_ts_ms} recv_ts_ms={recv_ts_ms}"
             )
 
-        if args.max_samples > 0 and sample_count >= args.max_samples:
+        sample_count += 1
+        if max_samples is not None and sample_count >= max_samples:
             stop_event.set()
 
     sub = session.declare_subscriber(key_meta, on_meta)
@@ -446,23 +1313,36 @@ def cmd_camera_latency(args: argparse.Namespace) -> int:
                 time.sleep(0.1)
     finally:
         sub.undeclare()
-        session.close()
-
-    with lock:
-        snapshot = list(samples)
-
-    read_vals = [s["read_ms"] for s in snapshot if isinstance(s.get("read_ms"), (int, float))]
-    pipeline_vals = [s["pipeline_ms"] for s in snapshot if isinstance(s.get("pipeline_ms"), (int, float))]
-    publish_to_remote_vals = [
-        s["publish_to_remote_ms"]
-        for s in snapshot
-        if isinstance(s.get("publish_to_remote_ms"), (int, float))
-    ]
-    start_to_publish_vals = [
-        s["start_to_publish_ms"]
-        for s in snapshot
-        if isinstance(s.get("start_to_publish_ms"), (int, float))
-    ]
+        _release_session(session)
+
+    snapshot = list(samples)
+
+    if hists is not None:
+        for name in fields:
+            _print_stats(name, _summarize_hist(hists[name], out_of_range[name]))
+        if args.plot or args.plot_out:
+            _plot_latency(snapshot, title=args.plot_title, out_path=args.plot_out, show=bool(args.plot))
+        return 0
+
+    # Fields were normalized to float | None in on_meta, so one pass with
+    # "is not None" checks replaces four isinstance-filtered scans.
+    read_vals: list[float] = []
+    pipeline_vals: list[float] = []
+    publish_to_remote_vals: list[float] = []
+    start_to_publish_vals: list[float] = []
+    for entry in snapshot:
+        v = entry["read_ms"]
+        if v is not None:
+            read_vals.append(v)
+        v = entry["pipeline_ms"]
+        if v is not None:
+            pipeline_vals.append(v)
+        v = entry["publish_to_remote_ms"]
+        if v is not None:
+            publish_to_remote_vals.append(v)
+        v = entry["start_to_publish_ms"]
+        if v is not None:
+            start_to_publish_vals.append(v)
 
     _print_summary("read_ms", read_vals)
     _print_summary("pipeline_ms", pipeline_vals)
@@ -485,10 +1365,10 @@ class _H264JpegRepublisher:
         key_suffix_meta: Optional[str],
         jpeg_quality: Optional[int],
     ) -> None:
-        self._pub_jpeg = session.declare_publisher(_key(robot_id, key_suffix_jpeg))
+        self._pub_jpeg = _declare_publisher(session, _key(robot_id, key_suffix_jpeg))
         self._pub_meta = None
         if key_suffix_meta:
-            self._pub_meta = session.declare_publisher(_key(robot_id, key_suffix_meta))
+            self._pub_meta = _declare_publisher(session, _key(robot_id, key_suffix_meta))
         self._jpeg_quality = jpeg_quality
         self._proc: Optional[subprocess.Popen[bytes]] = None
         self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=60)
@@ -606,7 +1486,7 @@ class _H264JpegRepublisher:
             return
         if self._pub_meta is None:
             return
-        now_ms = int(time.time() * 1000)
+        now_ms = _now_ms()
         payload = {
             "source": "remote_h264",
             "seq": self._seq,
@@ -617,7 +1497,7 @@ class _H264JpegRepublisher:
                 payload[key] = self._last_meta[key]
         self._seq += 1
         try:
-            self._pub_meta.put(json.dumps(payload).encode("utf-8"))
+            self._pub_meta.put(_dumps(payload))
         except Exception:
             return
 
@@ -640,6 +1520,12 @@ class _H264JpegRepublisher:
         self._proc = None
 
 
+# Write buffers for the H.264 sinks. ffplay keeps the default (small) pipe buffer so
+# live playback is not delayed by batching.
+_H264_FILE_BUFSIZE = 256 * 1024
+_H264_PIPE_BUFSIZE = 64 * 1024
+
+
 def cmd_camera_h264(args: argparse.Namespace) -> int:
     key_video = _key(args.robot_id, "camera/video/h264")
     key_meta = _key(args.robot_id, "camera/video/h264/meta")
@@ -651,7 +1537,8 @@ def cmd_camera_h264(args: argparse.Namespace) -> int:
     if not args.no_raw:
         out_path = Path(args.out)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_fp = out_path.open("wb")
+        # Large buffer so NAL units are written in batches (unless --flush).
+        out_fp = out_path.open("wb", buffering=_H264_FILE_BUFSIZE)
     play_state: dict[str, Optional[object]] = {"stdin": None}
     encode_state: dict[str, Optional[object]] = {"stdin": None}
     republisher: Optional[_H264JpegRepublisher] = None
@@ -705,7 +1592,7 @@ def cmd_camera_h264(args: argparse.Namespace) -> int:
                 cmd.extend(["-movflags", "+faststart"])
             cmd.append(str(encode_path))
             try:
-                proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+                proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, bufsize=_H264_PIPE_BUFSIZE)
                 encode_state["proc"] = proc
                 encode_state["stdin"] = proc.stdin
             except Exception as e:
@@ -724,7 +1611,14 @@ def cmd_camera_h264(args: argparse.Namespace) -> int:
         )
 
     def on_video(sample: Any) -> None:
-        payload = sample.payload.to_bytes()
+        if (
+            out_fp is None
+            and play_state.get("stdin") is None
+            and encode_state.get("stdin") is None
+            and republisher is None
+        ):
+            return
+        payload = _payload_view(sample)
         with lock:
             if out_fp:
                 out_fp.write(payload)
@@ -747,18 +1641,19 @@ def cmd_camera_h264(args: argparse.Namespace) -> int:
                 except BrokenPipeError:
                     encode_state["stdin"] = None
             if republisher is not None:
-                republisher.push(payload)
+                # Queued for another thread, so it needs its own copy.
+                republisher.push(bytes(payload))
 
     def on_meta(sample: Any) -> None:
-        if not args.print_meta and republisher is None:
+        if args.print_meta:
+            _write_payload_line(sample, b"meta: ")
+        if republisher is None:
             return
         try:
             meta = _decode_json_payload(sample)
         except Exception:
             return
-        if args.print_meta:
-            print("meta:", json.dumps(meta, ensure_ascii=False))
-        if republisher is not None and isinstance(meta, dict):
+        if isinstance(meta, dict):
             republisher.update_meta(meta)
 
     sub_video = session.declare_subscriber(key_video, on_video)
@@ -791,7 +1686,7 @@ def cmd_camera_h264(args: argparse.Namespace) -> int:
                         pass
         if republisher is not None:
             republisher.close()
-        session.close()
+        _release_session(session)
     if out_path:
         print(f"saved: {out_path}")
     if args.encode_out:
@@ -799,28 +1694,43 @@ def cmd_camera_h264(args: argparse.Namespace) -> int:
     return 0
 
 
+# --print-points converts angles with NumPy above this many points.
+_PRINT_POINTS_NUMPY_MIN = 32
+
+
 def cmd_lidar(args: argparse.Namespace) -> int:
     key_scan = _key(args.robot_id, "lidar/scan")
     key_front = _key(args.robot_id, "lidar/front")
     session = args.open_session()
 
     def on_front(sample: Any) -> None:
-        try:
-            print(json.dumps(_decode_json_payload(sample), ensure_ascii=False))
-        except Exception as e:
-            print(f"decode failed: {e}")
+        _write_payload_line(sample)
+
+    max_points = int(args.max_points)
+    _deg = math.degrees
+    write_line = _SINK.write_line
 
     def on_scan(sample: Any) -> None:
+        if args.print_json:
+            _write_payload_line(sample)
+            return
+
+        if not args.print_points:
+            # Summary only: read seq/ts_ms and count points from the raw bytes instead
+            # of building a dict per point.
+            raw = sample.payload.to_bytes()
+            seq = _extract_int(raw, b"seq")
+            ts_ms = _extract_int(raw, b"ts_ms")
+            n = raw.count(b'"angle_rad"')
+            write_line(f"scan: seq={seq} ts_ms={ts_ms} points={n}")
+            return
+
         try:
             payload = _decode_json_payload(sample)
         except Exception as e:
             print(f"decode failed: {e}")
             return
 
-        if args.print_json:
-            print(json.dumps(payload, ensure_ascii=False))
-            return
-
         seq = payload.get("seq")
         ts_ms = payload.get("ts_ms")
         points = payload.get("points") or []
@@ -828,37 +1738,42 @@ def cmd_lidar(args: argparse.Namespace) -> int:
             n = len(points)
         except Exception:
             n = 0
-        print(f"scan: seq={seq} ts_ms={ts_ms} points={n}")
+        write_line(f"scan: seq={seq} ts_ms={ts_ms} points={n}")
 
-        if not args.print_points:
-            return
-
-        import math
-
-        max_points = int(args.max_points)
+        rows = []
         for i, p in enumerate(points[:max_points]):
             try:
                 angle_rad = float(p.get("angle_rad"))
                 range_m = float(p.get("range_m"))
             except Exception:
                 continue
-            angle_deg = math.degrees(angle_rad)
-            intensity = p.get("intensity")
+            rows.append((i, angle_rad, range_m, p.get("intensity")))
+        if np is not None and max_points > _PRINT_POINTS_NUMPY_MIN and rows:
+            angles = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+            angles_deg = np.degrees(angles).tolist()
+        else:
+            angles_deg = [_deg(row[1]) for row in rows]
+
+        # Format every row first and hand them to the sink as one block.
+        lines = []
+        for (i, _, range_m, intensity), angle_deg in zip(rows, angles_deg):
             if intensity is None:
-                print(f"  {i:04d}: angle_deg={angle_deg:8.2f} range_m={range_m:6.3f}")
+                lines.append(f"  {i:04d}: angle_deg={angle_deg:8.2f} range_m={range_m:6.3f}\n")
             else:
                 try:
                     inten = float(intensity)
                 except Exception:
                     inten = intensity
-                print(f"  {i:04d}: angle_deg={angle_deg:8.2f} range_m={range_m:6.3f} intensity={inten}")
+                lines.append(f"  {i:04d}: angle_deg={angle_deg:8.2f} range_m={range_m:6.3f} intensity={inten}\n")
+        if lines:
+            _SINK.write("".join(lines).encode("utf-8"))
 
     subs = []
     try:
         if args.scan:
-            subs.append(session.declare_subscriber(key_scan, on_scan))
+            subs.append(_declare_drained_subscriber(session, key_scan, on_scan))
         if args.front:
-            subs.append(session.declare_subscriber(key_front, on_front))
+            subs.append(_declare_drained_subscriber(session, key_front, on_front))
         input("subscribing lidar... press Enter to quit\n")
     finally:
         for sub in subs:
@@ -866,10 +1781,26 @@ def cmd_lidar(args: argparse.Namespace) -> int:
                 sub.undeclare()
             except Exception:
                 pass
-        session.close()
+        _release_session(session)
     return 0
 
 
+# Subcommand name -> handler.
+HANDLERS: dict[str, Any] = {
+    "daemon": cmd_daemon,
+    "motor": cmd_motor,
+    "stop": cmd_stop,
+    "oled": cmd_oled,
+    "oled-image": cmd_oled_image_mono1,
+    "imu": cmd_imu,
+    "motor-telemetry": cmd_motor_telemetry,
+    "camera": cmd_camera,
+    "camera-h264": cmd_camera_h264,
+    "camera-latency": cmd_camera_latency,
+    "lidar": cmd_lidar,
+}
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     p = argparse.ArgumentParser(description="Minimal remote Zenoh control tool for dmc_ai_mobility")
     p.epilog = (
@@ -896,8 +1827,18 @@ def main(argv: Optional[list[str]] = None) -> int:
         "If set, it is applied on top of defaults or --zenoh-config.",
     )
 
+    p.add_argument(
+        "--daemon-socket",
+        type=Path,
+        default=_default_daemon_socket(),
+        help="Unix socket of a running `daemon`; motor/stop/oled/oled-image publish through it when present.",
+    )
+    p.add_argument("--no-daemon", action="store_true", help="Always open a Zenoh session directly.")
+
     sub = p.add_subparsers(dest="cmd", required=True)
 
+    sub.add_parser("daemon", help="Keep one Zenoh session open and publish for other invocations")
+
     motor = sub.add_parser("motor", help="Publish motor/cmd for a duration")
     motor.add_argument("--v-l", type=float, required=True)
     motor.add_argument("--v-r", type=float, required=True)
@@ -905,17 +1846,26 @@ def main(argv: Optional[list[str]] = None) -> int:
     motor.add_argument("--deadman-ms", type=int, default=300)
     motor.add_argument("--duration-s", type=float, default=2.0)
     motor.add_argument("--hz", type=float, default=20.0)
-    motor.set_defaults(func=cmd_motor)
+    motor.add_argument(
+        "--wire", choices=("json", "msgpack"), default="json", help="Payload encoding (msgpack needs msgspec)"
+    )
+    motor.add_argument(
+        "--batch",
+        type=int,
+        default=1,
+        help="Send N commands per publish as length-prefixed frames (adds up to N/hz latency)",
+    )
 
     stop = sub.add_parser("stop", help="Publish zero motor command a few times")
     stop.add_argument("--unit", type=str, default="mps")
     stop.add_argument("--deadman-ms", type=int, default=300)
     stop.add_argument("--count", type=int, default=5)
-    stop.set_defaults(func=cmd_stop)
+    stop.add_argument(
+        "--wire", choices=("json", "msgpack"), default="json", help="Payload encoding (msgpack needs msgspec)"
+    )
 
     oled = sub.add_parser("oled", help="Publish oled/cmd once")
     oled.add_argument("--text", type=str, required=True)
-    oled.set_defaults(func=cmd_oled)
 
     oled_img = sub.add_parser("oled-image", help="Publish oled/image/mono1 once (raw mono1 bytes)")
     oled_img_src = oled_img.add_mutually_exclusive_group(required=True)
@@ -924,18 +1874,26 @@ def main(argv: Optional[list[str]] = None) -> int:
     oled_img.add_argument("--width", type=int, default=128)
     oled_img.add_argument("--height", type=int, default=32)
     oled_img.add_argument("--invert", action="store_true", help="Invert input image before mono1 conversion")
-    oled_img.set_defaults(func=cmd_oled_image_mono1)
 
-    imu = sub.add_parser("imu", help="Subscribe imu/state and print JSON")
-    imu.set_defaults(func=cmd_imu)
+    sub.add_parser("imu", help="Subscribe imu/state and print JSON")
 
-    motor_telemetry = sub.add_parser("motor-telemetry", help="Subscribe motor/telemetry and print JSON")
-    motor_telemetry.set_defaults(func=cmd_motor_telemetry)
+    sub.add_parser("motor-telemetry", help="Subscribe motor/telemetry and print JSON")
 
     cam = sub.add_parser("camera", help="Subscribe camera jpeg/meta and save JPEGs")
     cam.add_argument("--out-dir", type=Path, default=Path("./camera_frames"))
     cam.add_argument("--print-meta", action="store_true")
-    cam.set_defaults(func=cmd_camera)
+    cam.add_argument(
+        "--concat-out",
+        type=str,
+        default=None,
+        help="Append frames to one file as [4-byte big-endian length][jpeg] records instead of --out-dir",
+    )
+    cam.add_argument(
+        "--concat-ring-mb",
+        type=float,
+        default=0.0,
+        help="With --concat-out: keep the newest frames in a fixed-size memory-mapped ring of this many MiB",
+    )
 
     cam_h264 = sub.add_parser("camera-h264", help="Subscribe camera/video/h264 and save stream")
     cam_h264.add_argument("--out", type=str, default="./camera_stream.h264")
@@ -964,7 +1922,6 @@ def main(argv: Optional[list[str]] = None) -> int:
         default=None,
         help="ffmpeg jpeg quality (2-31). Lower is better.",
     )
-    cam_h264.set_defaults(func=cmd_camera_h264)
 
     cam_latency = sub.add_parser("camera-latency", help="Subscribe camera/meta and report latency stats")
     cam_latency.add_argument(
@@ -983,7 +1940,6 @@ def main(argv: Optional[list[str]] = None) -> int:
     cam_latency.add_argument("--plot", action="store_true", help="Show matplotlib graph (requires matplotlib)")
     cam_latency.add_argument("--plot-out", type=Path, default=None, help="Save graph to a file (png)")
     cam_latency.add_argument("--plot-title", type=str, default=None, help="Optional plot title")
-    cam_latency.set_defaults(func=cmd_camera_latency)
 
     lidar = sub.add_parser("lidar", help="Subscribe lidar scan/front and print")
     lidar.add_argument("--scan", action="store_true", help="Subscribe lidar/scan (angle-wise raw values)")
@@ -991,15 +1947,21 @@ def main(argv: Optional[list[str]] = None) -> int:
     lidar.add_argument("--print-json", action="store_true", help="Print scan payload as raw JSON")
     lidar.add_argument("--print-points", action="store_true", help="Print per-point angle/range from scan payload")
     lidar.add_argument("--max-points", type=int, default=100, help="Max points to print when --print-points")
-    lidar.set_defaults(func=cmd_lidar)
 
     args = p.parse_args(argv)
     if args.cmd == "lidar" and not getattr(args, "scan", False) and not getattr(args, "front", False):
         args.front = True
-    args.open_session = _build_session_opener(
-        config_path=args.zenoh_config, mode=args.mode, connect_endpoints=list(args.connect)
-    )
-    return int(args.func(args))
+    args.cfg_overrides = _connect_overrides(args.mode, list(args.connect))
+    args.open_session = _build_session_opener(config_path=args.zenoh_config, overrides=args.cfg_overrides)
+    if args.cmd in _DAEMON_CLIENT_CMDS and not args.no_daemon:
+        daemon_session = _connect_daemon(args.daemon_socket, args.open_session)
+        if daemon_session is not None:
+            args.open_session = lambda: daemon_session
+    try:
+        return int(HANDLERS[args.cmd](args))
+    finally:
+        # Emit lines still batched in the sink before the caller prints anything else.
+        _SINK.flush()
 
 
 if __name__ == "__main__":
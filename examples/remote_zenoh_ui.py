@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import math
+import os
 import queue
 import shutil
 import subprocess
@@ -10,10 +13,34 @@ import sys
 import threading
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson  # optional: faster (de)serialization, bytes in/out
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    # UTF-8 JSON bytes; non-ASCII text is kept as-is (like ensure_ascii=False).
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _dumps_text(obj: Any) -> str:
+    # Compact JSON for labels and the raw IMU view.
+    return str(_dumps(obj), "utf-8")
+
+
+def _loads(raw: bytes | memoryview) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(str(raw, "utf-8"))
+
 
 def _load_toml_file(path: Path) -> dict[str, Any]:
     try:
@@ -28,7 +55,9 @@ def _load_toml_file(path: Path) -> dict[str, Any]:
             ) from e
 
     try:
-        data = tomllib.loads(path.read_text(encoding="utf-8"))
+        # tomllib parses the byte stream itself; no read_text() + decode copy first.
+        with path.open("rb") as f:
+            data = tomllib.load(f)
     except FileNotFoundError:
         raise SystemExit(f"config not found: {path}")
     except Exception as e:
@@ -67,6 +96,25 @@ class UIConfig:
     lidar_flip_y: bool = False
 
 
+# Upper bound of the "max points" control; sizes the lidar XY scratch buffer.
+_LIDAR_MAX_POINTS_CAP = 50000
+
+# UIConfig field -> ([section], key, kind, lo, hi). Out-of-range values are clamped and
+# values of the wrong type fall back to the UIConfig default.
+_UI_CONFIG_FIELDS: tuple[tuple[str, str, str, str, Any, Any], ...] = (
+    ("motor_speed_step_mps", "motor", "speed_step_mps", "float", 0.0, 2.0),
+    ("motor_publish_hz", "motor", "publish_hz", "float", 1.0, 60.0),
+    ("motor_deadman_ms", "motor", "deadman_ms", "int", 50, 2000),
+    ("lidar_update_hz", "lidar", "update_hz", "float", 1.0, 60.0),
+    ("lidar_max_points", "lidar", "max_points", "int", 100, _LIDAR_MAX_POINTS_CAP),
+    ("lidar_range_m", "lidar", "range_m", "float", 0.0, 1.0),
+    ("lidar_flip_y", "lidar", "flip_y", "bool", None, None),
+)
+
+# (path, mtime_ns) -> parsed config; an edited file gets a new key.
+_UI_CFG_CACHE: dict[tuple[str, int], UIConfig] = {}
+
+
 def _load_ui_config(path: Optional[Path]) -> UIConfig:
     """
     Reads `config.toml` and returns UI defaults.
@@ -78,75 +126,33 @@ def _load_ui_config(path: Optional[Path]) -> UIConfig:
     if path is None:
         return UIConfig()
 
-    data = _load_toml_file(path)
-    motor = _toml_get(data, ("motor",), {})
-    lidar = _toml_get(data, ("lidar",), {})
-
-    def _f(x: Any, default: float) -> float:
-        try:
-            return float(x)
-        except Exception:
-            return float(default)
+    try:
+        cache_key: Optional[tuple[str, int]] = (str(path), path.stat().st_mtime_ns)
+    except OSError:
+        cache_key = None  # let the loader report the error
+    if cache_key is not None:
+        cached = _UI_CFG_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
-    def _i(x: Any, default: int) -> int:
+    data = _load_toml_file(path)
+    values: dict[str, Any] = {}
+    for field, section, key, kind, lo, hi in _UI_CONFIG_FIELDS:
+        default = getattr(UIConfig, field)
+        raw = _toml_get(data, (section, key), default)
+        if kind == "bool":
+            values[field] = raw if isinstance(raw, bool) else default
+            continue
         try:
-            return int(x)
+            v = float(raw) if kind == "float" else int(raw)
         except Exception:
-            return int(default)
-
-    def _b(x: Any, default: bool) -> bool:
-        if isinstance(x, bool):
-            return x
-        return bool(default)
-
-    speed_step = _clamp(
-        _f(
-            _toml_get(motor, ("speed_step_mps",), UIConfig.motor_speed_step_mps),
-            UIConfig.motor_speed_step_mps,
-        ),
-        0.0,
-        2.0,
-    )
-    publish_hz = _clamp(
-        _f(_toml_get(motor, ("publish_hz",), UIConfig.motor_publish_hz), UIConfig.motor_publish_hz),
-        1.0,
-        60.0,
-    )
-    deadman = _clamp_int(
-        _i(_toml_get(motor, ("deadman_ms",), UIConfig.motor_deadman_ms), UIConfig.motor_deadman_ms),
-        50,
-        2000,
-    )
+            v = default
+        values[field] = _clamp(v, lo, hi) if kind == "float" else _clamp_int(v, lo, hi)
 
-    lidar_update_hz = _clamp(
-        _f(_toml_get(lidar, ("update_hz",), UIConfig.lidar_update_hz), UIConfig.lidar_update_hz),
-        1.0,
-        60.0,
-    )
-    lidar_max_points = _clamp_int(
-        _i(
-            _toml_get(lidar, ("max_points",), UIConfig.lidar_max_points),
-            UIConfig.lidar_max_points,
-        ),
-        100,
-        50000,
-    )
-    lidar_range_m = _clamp(
-        _f(_toml_get(lidar, ("range_m",), UIConfig.lidar_range_m), UIConfig.lidar_range_m),
-        0.0,
-        1.0,
-    )
-    lidar_flip_y = _b(_toml_get(lidar, ("flip_y",), UIConfig.lidar_flip_y), UIConfig.lidar_flip_y)
-
-    return UIConfig(
-        motor_speed_step_mps=speed_step,
-        motor_publish_hz=publish_hz,
-        motor_deadman_ms=deadman,
-        lidar_update_hz=lidar_update_hz,
-        lidar_max_points=lidar_max_points,
-        lidar_range_m=lidar_range_m,
-        lidar_flip_y=lidar_flip_y,
-    )
+    cfg = UIConfig(**values)
+    if cache_key is not None:
+        _UI_CFG_CACHE[cache_key] = cfg
+    return cfg
 
 
 def _key(robot_id: str, suffix: str) -> str:
@@ -155,6 +161,26 @@ def _key(robot_id: str, suffix: str) -> str:
     return f"dmc_robo/{robot_id}/{suffix}"
 
 
+# Every topic the UI publishes or subscribes to, relative to dmc_robo/<robot_id>/.
+_TOPICS = (
+    "motor/cmd",
+    "oled/cmd",
+    "motor/telemetry",
+    "imu/state",
+    "camera/meta/remote",
+    "camera/image/jpeg/remote",
+    "camera/video/h264",
+    "camera/video/h264/meta",
+    "lidar/scan",
+    "lidar/front",
+)
+
+
+def _topic_keys(robot_id: str) -> dict[str, str]:
+    _key(robot_id, "")  # validate once
+    return {suffix: f"dmc_robo/{robot_id}/{suffix}" for suffix in _TOPICS}
+
+
 def _apply_connect_overrides(cfg: Any, mode: str, connect_endpoints: list[str]) -> Any:
     if mode:
         cfg.insert_json5("mode", json.dumps(mode))
@@ -194,45 +220,214 @@ def _build_session_opener(
     return _opener
 
 
+class _LatestSlot:
+    """Latest-value holder handed from a worker thread to a GUI timer.
+
+    deque(maxlen=1) makes set() and take() single atomic operations: a newer value
+    replaces an unread one and nothing is queued on the Qt event loop.
+    """
+
+    __slots__ = ("_box",)
+
+    def __init__(self) -> None:
+        self._box: "deque[Any]" = deque(maxlen=1)
+
+    def set(self, value: Any) -> None:
+        self._box.append(value)
+
+    def take(self) -> Any:
+        try:
+            return self._box.popleft()
+        except IndexError:
+            return None
+
+
+# GUI poll rate for high-rate topics delivered through _LatestSlot.
+_IMU_POLL_HZ = 30.0
+# Samples kept in the IMU plot window.
+_IMU_PLOT_LEN = 400
+# Minimum interval between re-renders of the pretty-printed raw IMU JSON.
+_IMU_RAW_RENDER_INTERVAL_NS = 100_000_000
+
+
 class _Bridge:
+    __slots__ = ("_b", "imu_latest")
+
     def __init__(self) -> None:
         from PySide6.QtCore import QObject, Signal
 
         class _B(QObject):
             log = Signal(str)
-            imu = Signal(object)  # dict
             motor_telemetry = Signal(object)  # dict
-            cam_jpeg = Signal(bytes)
+            cam_jpeg = Signal(object)  # bytes or memoryview
             cam_meta = Signal(object)  # dict
-            cam_h264_frame = Signal(object)  # tuple(width, height, bytes)
+            cam_h264_frame = Signal(object)  # tuple(width, height, memoryview, release)
             cam_h264_meta = Signal(object)  # dict
             lidar_scan = Signal(object)  # dict
             lidar_front = Signal(object)  # dict
 
         self._b = _B()
+        # IMU arrives at ~100 Hz; the GUI polls the newest sample instead of receiving a
+        # queued signal per sample.
+        self.imu_latest = _LatestSlot()
 
     @property
     def qobj(self):
         return self._b
 
 
+def _payload_view(sample: Any) -> bytes | memoryview:
+    # Zero-copy view of the payload when it supports the buffer protocol.
+    payload = sample.payload
+    try:
+        return memoryview(payload)
+    except TypeError:
+        return payload.to_bytes()
+
+
 def _decode_json_payload(sample: Any) -> Any:
-    raw = sample.payload.to_bytes()
-    return json.loads(raw.decode("utf-8"))
+    return _loads(_payload_view(sample))
+
+
+# ffmpeg pipe sizing: a raw rgb24 frame is several MiB, so reads go through a 1 MiB
+# user-space buffer and the kernel pipes are widened (Linux F_SETPIPE_SZ) to cut
+# syscalls and writer/reader stalls.
+_FFMPEG_PIPE_BUFSIZE = 1 << 20
+
+
+def _widen_pipe(fileobj: Any, size: int = _FFMPEG_PIPE_BUFSIZE) -> None:
+    try:
+        import fcntl
+
+        fcntl.fcntl(fileobj.fileno(), getattr(fcntl, "F_SETPIPE_SZ", 1031), size)
+    except Exception:
+        # Not Linux, or above /proc/sys/fs/pipe-max-size: keep the default size.
+        pass
+
+
+# Decoded rgb24 frame buffers kept for reuse while in flight to the GUI.
+_H264_FRAME_POOL = 3
+
+# Encoded chunks buffered ahead of ffmpeg's stdin.
+_H264_QUEUE_LEN = 16
+
+
+def _h264_has_keyframe(chunk: bytes | memoryview) -> bool:
+    # Annex-B stream: a chunk carrying an SPS (7) or IDR slice (5) NAL is a point the
+    # decoder can restart from (the robot's encoder emits SPS/PPS inline with each IDR).
+    data = chunk if isinstance(chunk, bytes) else bytes(chunk)
+    i = data.find(b"\x00\x00\x01")
+    while 0 <= i < len(data) - 3:
+        if data[i + 3] & 0x1F in (5, 7):
+            return True
+        i = data.find(b"\x00\x00\x01", i + 3)
+    return False
+
+
+class _ChunkQueue:
+    """Chunks waiting for ffmpeg's stdin, plus the writer's stop flag.
+
+    Bounded: when a chunk arrives while full, the backlog is discarded and new chunks
+    are dropped until the next keyframe, since dropping arbitrary NAL units would leave
+    ffmpeg decoding garbage until the next IDR anyway. One instance per ffmpeg run.
+    """
+
+    __slots__ = ("_items", "_cond", "_limit", "_stopped", "_resync")
+
+    def __init__(self, limit: int) -> None:
+        self._items: "deque[bytes | memoryview]" = deque()
+        self._cond = threading.Condition()
+        self._limit = limit
+        self._stopped = False
+        self._resync = False
+
+    def put(self, chunk: bytes | memoryview) -> None:
+        with self._cond:
+            if self._stopped:
+                return
+            if self._resync or len(self._items) >= self._limit:
+                if not _h264_has_keyframe(chunk):
+                    self._items.clear()
+                    self._resync = True
+                    return
+                self._items.clear()
+                self._resync = False
+            self._items.append(chunk)
+            self._cond.notify()
+
+    def take_all(self) -> Optional[list[bytes | memoryview]]:
+        """Block for pending chunks; None once stop() was called."""
+        with self._cond:
+            while not self._items and not self._stopped:
+                self._cond.wait()
+            if self._stopped:
+                return None
+            batch = list(self._items)
+            self._items.clear()
+            return batch
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._items.clear()
+            self._cond.notify_all()
+
+
+def _write_chunks(stdin: Any, batch: list[Any]) -> None:
+    # One gather write per wakeup where the platform has writev: the chunks go to the
+    # pipe without being copied into stdin's buffer first.
+    writev = getattr(os, "writev", None)
+    if writev is None:
+        for chunk in batch:
+            stdin.write(chunk)
+        stdin.flush()
+        return
+    fd = stdin.fileno()
+    bufs = [memoryview(chunk).cast("B") for chunk in batch]
+    while bufs:
+        n = writev(fd, bufs)
+        # Partial write: drop what went out and resume mid-chunk.
+        while n:
+            head = bufs[0]
+            if n >= len(head):
+                n -= len(head)
+                bufs.pop(0)
+            else:
+                bufs[0] = head[n:]
+                n = 0
 
 
 class H264Decoder:
+    __slots__ = (
+        "_on_frame",
+        "_on_log",
+        "_proc",
+        "_chunks",
+        "_writer_thread",
+        "_reader_thread",
+        "_stop_event",
+        "_width",
+        "_height",
+        "_ffmpeg_missing",
+        "_frame_pool",
+    )
+
     def __init__(self, *, on_frame: Any, on_log: Any) -> None:
         self._on_frame = on_frame
         self._on_log = on_log
         self._proc: Optional[subprocess.Popen[bytes]] = None
-        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=60)
+        # Pending stream chunks; a stall resyncs at the next keyframe instead of leaving
+        # a backlog of stale data for ffmpeg to work through.
+        self._chunks = _ChunkQueue(_H264_QUEUE_LEN)
         self._writer_thread: Optional[threading.Thread] = None
         self._reader_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._width: Optional[int] = None
         self._height: Optional[int] = None
         self._ffmpeg_missing = False
+        # (frame_bytes, free buffers); kept across ffmpeg restarts at the same resolution
+        # so reconnects do not reallocate multi-MiB frames.
+        self._frame_pool: Optional[tuple[int, "queue.SimpleQueue[bytearray]"]] = None
 
     def configure(self, *, width: int, height: int) -> None:
         width = int(width)
@@ -280,75 +475,104 @@ class H264Decoder:
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                bufsize=0,
+                bufsize=_FFMPEG_PIPE_BUFSIZE,
             )
         except Exception as e:
             self._on_log(f"failed to start ffmpeg: {e}")
             self._proc = None
             return
+        _widen_pipe(self._proc.stdin)
+        _widen_pipe(self._proc.stdout)
+
+        frame_bytes = width * height * 3
+        if self._frame_pool is None or self._frame_pool[0] != frame_bytes:
+            free: "queue.SimpleQueue[bytearray]" = queue.SimpleQueue()
+            for _ in range(_H264_FRAME_POOL):
+                free.put(bytearray(frame_bytes))
+            self._frame_pool = (frame_bytes, free)
 
         self._stop_event.clear()
-        self._queue = queue.Queue(maxsize=60)
+        self._chunks = _ChunkQueue(_H264_QUEUE_LEN)
         self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
         self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
         self._writer_thread.start()
         self._reader_thread.start()
 
-    def push(self, data: bytes) -> None:
+    def push(self, data: bytes | memoryview) -> None:
         if self._proc is None:
             return
-        try:
-            self._queue.put_nowait(data)
-        except queue.Full:
-            return
+        self._chunks.put(data)
 
     def _writer_loop(self) -> None:
-        if self._proc is None or self._proc.stdin is None:
+        # Bound locally: configure() swaps in a new process/queue for the next writer.
+        proc = self._proc
+        chunks = self._chunks
+        if proc is None or proc.stdin is None:
             return
-        while not self._stop_event.is_set():
-            try:
-                chunk = self._queue.get(timeout=0.2)
-            except queue.Empty:
-                continue
-            if chunk is None:
+        stdin = proc.stdin
+        # Blocks until data or close(); no timeout polling. Each wakeup takes everything
+        # queued so a burst goes out in one write.
+        while True:
+            batch = chunks.take_all()
+            if batch is None:
                 break
             try:
-                self._proc.stdin.write(chunk)
+                _write_chunks(stdin, batch)
             except Exception:
                 break
         try:
-            if self._proc.stdin:
-                self._proc.stdin.close()
+            stdin.close()
         except Exception:
             pass
 
     def _reader_loop(self) -> None:
         if self._proc is None or self._proc.stdout is None:
             return
-        if self._width is None or self._height is None:
+        if self._width is None or self._height is None or self._frame_pool is None:
             return
-        frame_bytes = int(self._width * self._height * 3)
-        buf = bytearray(frame_bytes)
-        view = memoryview(buf)
+        width = self._width
+        height = self._height
+        # Frames are emitted as read-only views of pooled buffers (no per-frame copy).
+        # The GUI hands a buffer back through the release callback once it has copied
+        # the image. A buffer that never comes back (signal dropped at shutdown) is only
+        # garbage collected: an empty pool allocates a fresh one, and release() keeps at
+        # most _H264_FRAME_POOL of them.
+        frame_bytes, free = self._frame_pool
+
+        def release(buf: bytearray) -> None:
+            if free.qsize() < _H264_FRAME_POOL:
+                free.put(buf)
+
+        stdout = self._proc.stdout
         while not self._stop_event.is_set():
+            try:
+                buf = free.get_nowait()
+            except queue.Empty:
+                buf = bytearray(frame_bytes)
+            view = memoryview(buf)
             offset = 0
             while offset < frame_bytes:
-                chunk = self._proc.stdout.read(frame_bytes - offset)
-                if not chunk:
+                # Read straight into the frame buffer (no per-chunk bytes objects).
+                try:
+                    n = stdout.readinto(view[offset:])
+                except (OSError, ValueError):
+                    n = 0  # pipe closed under us by close()
+                if not n:
+                    release(buf)  # the pool outlives this ffmpeg process
                     return
-                view[offset : offset + len(chunk)] = chunk
-                offset += len(chunk)
+                offset += n
             try:
-                self._on_frame((self._width, self._height, bytes(buf)))
+                self._on_frame((width, height, view.toreadonly(), functools.partial(release, buf)))
             except Exception:
+                release(buf)
                 return
 
     def close(self) -> None:
         self._stop_event.set()
-        try:
-            self._queue.put_nowait(None)
-        except Exception:
-            pass
+        # Pending chunks are for the process being stopped; the stop flag is checked by
+        # the writer's wait, so a racing push() cannot keep it waiting.
+        self._chunks.stop()
+        # terminate() closes ffmpeg's stdout, so the reader's readinto() returns 0.
         if self._proc is not None:
             try:
                 if self._proc.stdin:
@@ -362,8 +586,34 @@ class H264Decoder:
         self._proc = None
 
 
+# motor/cmd has a fixed shape, so it is formatted directly instead of going through a
+# dict and the general-purpose encoder. %a renders floats with repr (shortest
+# round-trip form, valid JSON for finite values).
+_MOTOR_TEMPLATE = b'{"v_l":%a,"v_r":%a,"unit":%s,"deadman_ms":%d,"seq":%d,"ts_ms":%d}'
+
+
+@functools.lru_cache(maxsize=8)
+def _json_str(text: str) -> bytes:
+    return _dumps(text)
+
+
+def _encode_motor(v_l: float, v_r: float, unit: str, deadman_ms: int, seq: int, ts_ms: int) -> bytes:
+    v_l = float(v_l)
+    v_r = float(v_r)
+    if not (math.isfinite(v_l) and math.isfinite(v_r)):
+        # Leave non-finite values to the encoder's own handling.
+        return _dumps(
+            {"v_l": v_l, "v_r": v_r, "unit": unit, "deadman_ms": int(deadman_ms), "seq": int(seq), "ts_ms": int(ts_ms)}
+        )
+    return _MOTOR_TEMPLATE % (v_l, v_r, _json_str(unit), deadman_ms, seq, ts_ms)
+
+
 @dataclass
 class MotorCommand:
+    # Built per publish; slots drop the per-instance __dict__ (dataclass(slots=True)
+    # needs Python 3.10, this works on 3.9 because no field has a default).
+    __slots__ = ("v_l", "v_r", "unit", "deadman_ms", "seq", "ts_ms")
+
     v_l: float
     v_r: float
     unit: str
@@ -382,15 +632,38 @@ class MotorCommand:
         }
 
     def to_bytes(self) -> bytes:
-        return json.dumps(self.to_dict()).encode("utf-8")
+        return _encode_motor(self.v_l, self.v_r, self.unit, self.deadman_ms, self.seq, self.ts_ms)
 
 
 class ZenohClient:
+    __slots__ = (
+        "_open_session",
+        "_robot_id",
+        "_keys",
+        "_bridge",
+        "_print_publish",
+        "_h264_decoder",
+        "_session",
+        "_pub_motor",
+        "_pub_oled",
+        "_sub_motor_telemetry",
+        "_sub_imu",
+        "_sub_cam_meta",
+        "_sub_cam_jpeg",
+        "_sub_cam_h264",
+        "_sub_cam_h264_meta",
+        "_sub_lidar_scan",
+        "_sub_lidar_front",
+        "_decode_pool",
+        "_lidar_pool",
+    )
+
     def __init__(
         self, *, open_session: Any, robot_id: str, bridge: _Bridge, print_publish: bool
     ) -> None:
         self._open_session = open_session
         self._robot_id = robot_id
+        self._keys = _topic_keys(robot_id)
         self._bridge = bridge
         self._print_publish = bool(print_publish)
         self._h264_decoder = H264Decoder(
@@ -409,50 +682,71 @@ class ZenohClient:
         self._sub_cam_h264_meta: Any = None
         self._sub_lidar_scan: Any = None
         self._sub_lidar_front: Any = None
+        # JSON decode runs off the zenoh callback thread. One worker per executor keeps
+        # each topic in order; lidar/scan gets its own so big scans do not delay IMU.
+        self._decode_pool: Optional[ThreadPoolExecutor] = None
+        self._lidar_pool: Optional[ThreadPoolExecutor] = None
 
     def open(self) -> None:
         self._session = self._open_session()
-        key_motor = _key(self._robot_id, "motor/cmd")
-        key_oled = _key(self._robot_id, "oled/cmd")
+        keys = self._keys
+        key_motor = keys["motor/cmd"]
+        key_oled = keys["oled/cmd"]
         self._pub_motor = self._session.declare_publisher(key_motor)
         self._pub_oled = self._session.declare_publisher(key_oled)
-        self._key_motor = key_motor
-        self._key_oled = key_oled
         if self._print_publish:
             print(f"[pub] motor: {key_motor}", flush=True)
             print(f"[pub] oled : {key_oled}", flush=True)
 
-        def on_imu(sample: Any) -> None:
-            try:
-                payload = _decode_json_payload(sample)
-                self._bridge.qobj.imu.emit(payload)
-            except Exception as e:
-                self._bridge.qobj.log.emit(f"imu decode failed: {e}")
+        qobj = self._bridge.qobj
+        log = qobj.log.emit
+        self._decode_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ui-json")
+        self._lidar_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ui-lidar")
+
+        def _json_handler(emit: Any, label: Optional[str], pool: ThreadPoolExecutor) -> Any:
+            # JSON topics differ only in the signal they feed, how decode errors are
+            # reported and which worker decodes them; the callback is built once per topic.
+            loads = _loads
+            view = _payload_view
+            submit = pool.submit
+
+            def _decode(raw: Any) -> None:
+                try:
+                    payload = loads(raw)
+                except Exception as e:
+                    if label is not None:
+                        log(f"{label} decode failed: {e}")
+                    return
+                emit(payload)
 
-        def on_motor_telemetry(sample: Any) -> None:
-            try:
-                payload = _decode_json_payload(sample)
-                self._bridge.qobj.motor_telemetry.emit(payload)
-            except Exception as e:
-                self._bridge.qobj.log.emit(f"motor/telemetry decode failed: {e}")
+            def _on_sample(sample: Any) -> None:
+                try:
+                    # The view keeps the payload alive until the worker has decoded it.
+                    submit(_decode, view(sample))
+                except RuntimeError:
+                    return  # pool shut down by close()
 
-        def on_meta(sample: Any) -> None:
-            try:
-                payload = _decode_json_payload(sample)
-                self._bridge.qobj.cam_meta.emit(payload)
-            except Exception:
-                return
+            return _on_sample
+
+        pool = self._decode_pool
+        on_imu = _json_handler(self._bridge.imu_latest.set, "imu", pool)
+        on_motor_telemetry = _json_handler(qobj.motor_telemetry.emit, "motor/telemetry", pool)
+        on_meta = _json_handler(qobj.cam_meta.emit, None, pool)
+        on_lidar_scan = _json_handler(qobj.lidar_scan.emit, "lidar/scan", self._lidar_pool)
+        on_lidar_front = _json_handler(qobj.lidar_front.emit, "lidar/front", pool)
 
         def on_jpeg(sample: Any) -> None:
             try:
-                jpg = sample.payload.to_bytes()
+                # The view keeps the payload alive until the GUI thread decodes it.
+                jpg = _payload_view(sample)
                 self._bridge.qobj.cam_jpeg.emit(jpg)
             except Exception as e:
                 self._bridge.qobj.log.emit(f"camera jpeg receive failed: {e}")
 
         def on_h264(sample: Any) -> None:
             try:
-                chunk = sample.payload.to_bytes()
+                # Written to ffmpeg's stdin from the view; no intermediate bytes copy.
+                chunk = _payload_view(sample)
             except Exception as e:
                 self._bridge.qobj.log.emit(f"camera h264 receive failed: {e}")
                 return
@@ -469,41 +763,27 @@ class ZenohClient:
             if isinstance(width, (int, float)) and isinstance(height, (int, float)):
                 self._h264_decoder.configure(width=int(width), height=int(height))
 
-        def on_lidar_scan(sample: Any) -> None:
-            try:
-                payload = _decode_json_payload(sample)
-                self._bridge.qobj.lidar_scan.emit(payload)
-            except Exception as e:
-                self._bridge.qobj.log.emit(f"lidar/scan decode failed: {e}")
-
-        def on_lidar_front(sample: Any) -> None:
-            try:
-                payload = _decode_json_payload(sample)
-                self._bridge.qobj.lidar_front.emit(payload)
-            except Exception as e:
-                self._bridge.qobj.log.emit(f"lidar/front decode failed: {e}")
-
         self._sub_motor_telemetry = self._session.declare_subscriber(
-            _key(self._robot_id, "motor/telemetry"), on_motor_telemetry
+            keys["motor/telemetry"], on_motor_telemetry
         )
-        self._sub_imu = self._session.declare_subscriber(_key(self._robot_id, "imu/state"), on_imu)
+        self._sub_imu = self._session.declare_subscriber(keys["imu/state"], on_imu)
         self._sub_cam_meta = self._session.declare_subscriber(
-            _key(self._robot_id, "camera/meta/remote"), on_meta
+            keys["camera/meta/remote"], on_meta
         )
         self._sub_cam_jpeg = self._session.declare_subscriber(
-            _key(self._robot_id, "camera/image/jpeg/remote"), on_jpeg
+            keys["camera/image/jpeg/remote"], on_jpeg
         )
         self._sub_cam_h264 = self._session.declare_subscriber(
-            _key(self._robot_id, "camera/video/h264"), on_h264
+            keys["camera/video/h264"], on_h264
         )
         self._sub_cam_h264_meta = self._session.declare_subscriber(
-            _key(self._robot_id, "camera/video/h264/meta"), on_h264_meta
+            keys["camera/video/h264/meta"], on_h264_meta
         )
         self._sub_lidar_scan = self._session.declare_subscriber(
-            _key(self._robot_id, "lidar/scan"), on_lidar_scan
+            keys["lidar/scan"], on_lidar_scan
         )
         self._sub_lidar_front = self._session.declare_subscriber(
-            _key(self._robot_id, "lidar/front"), on_lidar_front
+            keys["lidar/front"], on_lidar_front
         )
 
         self._bridge.qobj.log.emit("zenoh connected")
@@ -565,6 +845,11 @@ class ZenohClient:
             self._pub_motor = None
             self._pub_oled = None
             self._h264_decoder.close()
+            for pool in (self._decode_pool, self._lidar_pool):
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            self._decode_pool = None
+            self._lidar_pool = None
 
     def publish_motor(self, cmd: MotorCommand) -> None:
         self.publish_motor_ex(cmd, print_msg=None)
@@ -572,12 +857,11 @@ class ZenohClient:
     def publish_motor_ex(self, cmd: MotorCommand, *, print_msg: Optional[bool]) -> None:
         if self._pub_motor is None:
             return
-        payload = cmd.to_dict()
-        self._pub_motor.put(json.dumps(payload).encode("utf-8"))
+        data = cmd.to_bytes()
+        self._pub_motor.put(data)
         do_print = self._print_publish if print_msg is None else bool(print_msg)
         if do_print:
-            key = getattr(self, "_key_motor", "motor/cmd")
-            print(f"[pub] {key} {json.dumps(payload, ensure_ascii=False)}", flush=True)
+            print(f"[pub] {self._keys['motor/cmd']} {data.decode('utf-8')}", flush=True)
 
     def publish_oled(self, text: str) -> None:
         self.publish_oled_ex(text, print_msg=None)
@@ -585,52 +869,53 @@ class ZenohClient:
     def publish_oled_ex(self, text: str, *, print_msg: Optional[bool]) -> None:
         if self._pub_oled is None:
             return
-        payload = {"text": str(text), "ts_ms": int(time.time() * 1000)}
-        self._pub_oled.put(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+        payload = {"text": str(text), "ts_ms": time.time_ns() // 1_000_000}
+        data = _dumps(payload)
+        self._pub_oled.put(data)
         do_print = self._print_publish if print_msg is None else bool(print_msg)
         if do_print:
-            key = getattr(self, "_key_oled", "oled/cmd")
-            print(f"[pub] {key} {json.dumps(payload, ensure_ascii=False)}", flush=True)
+            print(f"[pub] {self._keys['oled/cmd']} {data.decode('utf-8')}", flush=True)
+
+
+def _path_index(part: str) -> Optional[int]:
+    try:
+        return int(part)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_path(path: str) -> tuple[tuple[str, Optional[int]], ...]:
+    # "a.0.b" -> (("a", None), ("0", 0), ("b", None)): split and int-parsed once per
+    # distinct path instead of on every sample.
+    if not path:
+        return ()
+    return tuple((part, _path_index(part)) for part in path.split("."))
 
 
 def _get_by_path(obj: Any, path: str) -> Any:
     cur = obj
-    if not path:
-        return cur
-    for part in path.split("."):
+    for key, index in _compile_path(path):
         if isinstance(cur, dict):
-            cur = cur.get(part)
+            cur = cur.get(key)
         elif isinstance(cur, (list, tuple)):
+            if index is None:
+                return None
             try:
-                cur = cur[int(part)]
-            except Exception:
+                cur = cur[index]
+            except IndexError:
                 return None
         else:
             return None
     return cur
 
 
-def _extract_vec3(payload: Any, path: str) -> Optional[tuple[float, float, float]]:
-    candidate = _get_by_path(payload, path)
-    if candidate is None:
-        return None
-
-    if isinstance(candidate, dict):
-        for keys in (("x", "y", "z"), ("gx", "gy", "gz"), ("wx", "wy", "wz"), ("ax", "ay", "az")):
-            x, y, z = candidate.get(keys[0]), candidate.get(keys[1]), candidate.get(keys[2])
-            if all(isinstance(v, (int, float)) for v in (x, y, z)):
-                return float(x), float(y), float(z)
-        return None
-
-    if isinstance(candidate, (list, tuple)) and len(candidate) >= 3:
-        x, y, z = candidate[0], candidate[1], candidate[2]
-        if all(isinstance(v, (int, float)) for v in (x, y, z)):
-            return float(x), float(y), float(z)
-        return None
-
-    return None
-
-
+_VEC3_KEYSETS_ANY: tuple[tuple[str, str, str], ...] = (
+    ("x", "y", "z"),
+    ("gx", "gy", "gz"),
+    ("wx", "wy", "wz"),
+    ("ax", "ay", "az"),
+)
 _VEC3_KEYSETS_GYRO: tuple[tuple[str, str, str], ...] = (
     ("gx", "gy", "gz"),
     ("wx", "wy", "wz"),
@@ -649,46 +934,66 @@ def _extract_vec3_with_keysets(
     if candidate is None:
         return None
 
+    # float() does the numeric check: no per-value isinstance or generator frame.
     if isinstance(candidate, dict):
-        for keys in keysets:
-            x, y, z = candidate.get(keys[0]), candidate.get(keys[1]), candidate.get(keys[2])
-            if all(isinstance(v, (int, float)) for v in (x, y, z)):
+        get = candidate.get
+        for kx, ky, kz in keysets:
+            x = get(kx)
+            y = get(ky)
+            z = get(kz)
+            if x is None or y is None or z is None:
+                continue
+            try:
                 return float(x), float(y), float(z)
+            except (TypeError, ValueError):
+                continue
         return None
 
     if isinstance(candidate, (list, tuple)) and len(candidate) >= 3:
-        x, y, z = candidate[0], candidate[1], candidate[2]
-        if all(isinstance(v, (int, float)) for v in (x, y, z)):
-            return float(x), float(y), float(z)
-        return None
+        try:
+            return float(candidate[0]), float(candidate[1]), float(candidate[2])
+        except (TypeError, ValueError):
+            return None
 
     return None
 
 
+def _extract_vec3(payload: Any, path: str) -> Optional[tuple[float, float, float]]:
+    return _extract_vec3_with_keysets(payload, path, keysets=_VEC3_KEYSETS_ANY)
+
+
+# (candidates, keysets) -> last path that autodetect resolved ("" is the root). IMU
+# payloads keep their shape for a session, so the search normally runs once.
+_VEC3_PATH_CACHE: dict[tuple[tuple[str, ...], tuple[tuple[str, str, str], ...]], str] = {}
+
+
 def _autodetect_vec3(
     payload: Any,
     *,
     candidates: tuple[str, ...],
     keysets: tuple[tuple[str, str, str], ...],
 ) -> tuple[Optional[str], Optional[tuple[float, float, float]]]:
+    cache_key = (candidates, keysets)
+    cached = _VEC3_PATH_CACHE.get(cache_key)
+    if cached is not None:
+        vec = _extract_vec3_with_keysets(payload, cached, keysets=keysets)
+        if vec is not None:
+            return (cached or "<root>"), vec
+
     for path in candidates:
         vec = _extract_vec3_with_keysets(payload, path, keysets=keysets)
         if vec is not None:
+            _VEC3_PATH_CACHE[cache_key] = path
             return path, vec
 
-    q: deque[tuple[str, Any]] = deque([("", payload)])
+    # Paths are kept as tuples of parts and only joined for the match.
+    q: deque[tuple[tuple[str, ...], Any]] = deque([((), payload)])
     seen: set[int] = set()
     max_nodes = 500
 
-    def _push(base: str, k: str, v: Any) -> None:
-        if base:
-            q.append((f"{base}.{k}", v))
-        else:
-            q.append((k, v))
-
     while q and max_nodes > 0:
         max_nodes -= 1
-        path, obj = q.popleft()
+        parts, obj = q.popleft()
         obj_id = id(obj)
         if obj_id in seen:
             continue
@@ -701,62 +1006,75 @@ def _autodetect_vec3(
         else:
             vec = None
         if vec is not None:
+            path = ".".join(parts)
+            _VEC3_PATH_CACHE[cache_key] = path
             return (path or "<root>"), vec
 
         if isinstance(obj, dict):
             for k, v in obj.items():
                 if isinstance(k, str):
-                    _push(path, k, v)
+                    q.append((parts + (k,), v))
         elif isinstance(obj, (list, tuple)):
             for i, v in enumerate(obj[:10]):
-                _push(path, str(i), v)
+                q.append((parts + (str(i),), v))
 
     return None, None
 
 
-def _extract_lidar_points(payload: Any) -> tuple[Optional[int], Optional[int], list[tuple[float, float, Optional[float]]]]:
-    seq = None
-    ts_ms = None
-    if isinstance(payload, dict):
-        try:
-            seq = payload.get("seq")
-        except Exception:
-            seq = None
-        try:
-            ts_ms = payload.get("ts_ms")
-        except Exception:
-            ts_ms = None
-
-    points_any = payload.get("points") if isinstance(payload, dict) else None
-    if not isinstance(points_any, list):
-        return None, None, []
-
-    out: list[tuple[float, float, Optional[float]]] = []
+def _lidar_points_slow(points_any: list[Any], np: Any) -> Any:
+    angles: list[float] = []
+    ranges: list[float] = []
     for p in points_any:
-        angle = None
-        rng = None
-        intensity: Optional[float] = None
-
         if isinstance(p, dict):
             angle = p.get("angle_rad")
             rng = p.get("range_m")
-            intensity_any = p.get("intensity")
-            if isinstance(intensity_any, (int, float)):
-                intensity = float(intensity_any)
         elif isinstance(p, (list, tuple)) and len(p) >= 2:
             angle = p[0]
             rng = p[1]
-            if len(p) >= 3 and isinstance(p[2], (int, float)):
-                intensity = float(p[2])
-
+        else:
+            continue
         if not isinstance(angle, (int, float)) or not isinstance(rng, (int, float)):
             continue
-        out.append((float(angle), float(rng), intensity))
+        angles.append(angle)
+        ranges.append(rng)
+    out = np.empty((len(angles), 2), dtype=np.float32)
+    out[:, 0] = angles
+    out[:, 1] = ranges
+    return out
+
+
+def _extract_lidar_points(payload: Any) -> tuple[Optional[int], Optional[int], Any]:
+    """Return (seq, ts_ms, points) where points is an (N, 2) float32 array of
+    (angle_rad, range_m) rows."""
+    import numpy as np
+
+    seq = None
+    ts_ms = None
+    if isinstance(payload, dict):
+        seq = payload.get("seq")
+        ts_ms = payload.get("ts_ms")
+
+    points_any = payload.get("points") if isinstance(payload, dict) else None
+    if not isinstance(points_any, list):
+        return None, None, np.empty((0, 2), dtype=np.float32)
+
+    pts = None
+    if points_any and isinstance(points_any[0], (list, tuple)):
+        # Common shape: homogeneous [[angle, range, intensity], ...] rows convert in
+        # one C-level pass. Ragged rows or non-numeric cells take the checked path.
+        try:
+            arr = np.asarray(points_any, dtype=np.float32)
+        except (TypeError, ValueError):
+            arr = None
+        if arr is not None and arr.ndim == 2 and arr.shape[1] >= 2:
+            pts = arr[:, :2]
+    if pts is None:
+        pts = _lidar_points_slow(points_any, np)
 
     return (
         int(seq) if isinstance(seq, int) else None,
         int(ts_ms) if isinstance(ts_ms, int) else None,
-        out,
+        pts,
     )
 
 
@@ -765,9 +1083,10 @@ class MainWindow:
         self, *, client: ZenohClient, bridge: _Bridge, args: argparse.Namespace, ui_config: UIConfig
     ) -> None:
         from PySide6.QtCore import QEvent, QObject, QTimer, Qt
-        from PySide6.QtGui import QAction, QCloseEvent, QFont, QKeyEvent
+        from PySide6.QtGui import QAction, QCloseEvent, QFont, QImage, QKeyEvent, QPixmap
         from PySide6.QtWidgets import (
             QAbstractSpinBox,
+            QApplication,
             QCheckBox,
             QComboBox,
             QDoubleSpinBox,
@@ -791,13 +1110,26 @@ class MainWindow:
         import pyqtgraph as pg
         import numpy as np
 
+        # Qt names used on per-event / per-frame paths are resolved once here, so the
+        # handlers do not run import statements or repeated enum lookups.
         self._Qt = Qt
         self._QCloseEvent = QCloseEvent
         self._QEvent = QEvent
         self._QObject = QObject
         self._QKeyEvent = QKeyEvent
         self._QMessageBox = QMessageBox
+        self._QApplication = QApplication
+        self._QPlainTextEdit = QPlainTextEdit
+        self._QImage = QImage
+        self._QPixmap = QPixmap
         self._np = np
+        self._deactivate_events = (QEvent.ApplicationDeactivate, QEvent.WindowDeactivate)
+        self._key_events = (QEvent.KeyPress, QEvent.KeyRelease)
+        # WASD/QEZC drive as one combined command; R/F and U/J drive each wheel.
+        self._composite_keys = frozenset(
+            (Qt.Key_W, Qt.Key_A, Qt.Key_S, Qt.Key_X, Qt.Key_D, Qt.Key_Q, Qt.Key_E, Qt.Key_Z, Qt.Key_C)
+        )
+        self._motor_keys = self._composite_keys | {Qt.Key_R, Qt.Key_F, Qt.Key_U, Qt.Key_J}
 
         self._client = client
         self._bridge = bridge
@@ -811,10 +1143,13 @@ class MainWindow:
         self._print_publish = bool(getattr(args, "print_pub", False))
         self._print_pub_motor_all = bool(getattr(args, "print_pub_motor_all", False))
         self._last_motor_print: Optional[tuple[float, float]] = None
-        self._last_motor_print_t = 0.0
-        self._motor_last_pub_t: Optional[float] = None
-        self._motor_dt_s: deque[float] = deque(maxlen=200)
-        self._motor_period_last_print_t = 0.0
+        # Publish timing in integer monotonic nanoseconds; the window sum is kept
+        # alongside the deque so the average does not re-sum it on every publish.
+        self._last_motor_print_ns = 0
+        self._motor_last_pub_ns: Optional[int] = None
+        self._motor_dt_ns: deque[int] = deque(maxlen=200)
+        self._motor_dt_sum_ns = 0
+        self._motor_period_last_print_ns = 0
         self._print_motor_period = bool(getattr(args, "print_motor_period", False))
 
         class _Win(QMainWindow):
@@ -930,7 +1265,7 @@ class MainWindow:
         lidar_box = QGroupBox("LiDAR")
         lidar_form = QFormLayout(lidar_box)
         self._spin_lidar_max_points = QSpinBox()
-        self._spin_lidar_max_points.setRange(100, 50000)
+        self._spin_lidar_max_points.setRange(100, _LIDAR_MAX_POINTS_CAP)
         self._spin_lidar_max_points.setValue(int(self._ui_config.lidar_max_points))
         lidar_form.addRow("max points", self._spin_lidar_max_points)
         self._spin_lidar_range_m = QDoubleSpinBox()
@@ -1030,7 +1365,11 @@ class MainWindow:
         self._lidar_front_arrow = pg.ArrowItem(pos=(0.0, 0.35), angle=90, brush=pg.mkBrush("c"), pen=pg.mkPen("c"))
         self._lidar_plot.addItem(self._lidar_front_arrow)
 
-        self._lidar_scatter = pg.ScatterPlotItem(size=2, pen=None, brush=pg.mkBrush(255, 255, 0, 200))
+        # One uniform symbol/size/brush for every spot: a single cached symbol pixmap is
+        # blitted per point in pixel mode instead of per-spot styling.
+        self._lidar_scatter = pg.ScatterPlotItem(
+            size=2, pen=None, brush=pg.mkBrush(255, 255, 0, 200), pxMode=True, useCache=True
+        )
         self._lidar_plot.addItem(self._lidar_scatter)
         lidar_layout.addWidget(self._lidar_plot, 1)
         right_split.addWidget(lidar_panel)
@@ -1047,9 +1386,16 @@ class MainWindow:
         self._curve_x = self._plot.plot([], [], pen=pg.mkPen("r", width=2), name="x")
         self._curve_y = self._plot.plot([], [], pen=pg.mkPen("g", width=2), name="y")
         self._curve_z = self._plot.plot([], [], pen=pg.mkPen("b", width=2), name="z")
+        # Redraw cost follows the visible pixels, not the buffered samples: peak
+        # downsampling keeps spikes, and clipping skips samples outside the view (t is
+        # monotonic, as clipping requires).
+        for curve in (self._curve_x, self._curve_y, self._curve_z):
+            curve.setDownsampling(auto=True, method="peak")
+            curve.setClipToView(True)
         self._raw = QPlainTextEdit()
         self._raw.setReadOnly(True)
-        self._raw.setMaximumBlockCount(2000)
+        # One compact line per rendered sample; Qt drops the oldest lines past the cap.
+        self._raw.setMaximumBlockCount(200)
         self._raw.setPlaceholderText("imu raw JSON will appear here")
         imu_layout.addWidget(self._plot, 2)
         imu_layout.addWidget(QLabel("IMU raw JSON"))
@@ -1070,10 +1416,12 @@ class MainWindow:
 
         # Data buffers
         self._t0 = time.monotonic()
-        self._buf_t: deque[float] = deque(maxlen=400)
-        self._buf_x: deque[float] = deque(maxlen=400)
-        self._buf_y: deque[float] = deque(maxlen=400)
-        self._buf_z: deque[float] = deque(maxlen=400)
+        # IMU plot ring: rows t, x, y, z. Each sample is written at head and head + N, so
+        # the newest `count` samples are always one contiguous slice and the curves get
+        # array views instead of lists rebuilt from deques.
+        self._imu_ring = np.zeros((4, 2 * _IMU_PLOT_LEN), dtype=np.float64)
+        self._imu_head = 0
+        self._imu_count = 0
 
         # Wiring
         self._btn_oled.clicked.connect(self._on_send_oled)
@@ -1081,7 +1429,6 @@ class MainWindow:
         self._combo_imu_plot.currentTextChanged.connect(self._on_imu_plot_changed)
 
         bridge.qobj.log.connect(self._append_log)
-        bridge.qobj.imu.connect(self._on_imu)
         bridge.qobj.motor_telemetry.connect(self._on_motor_telemetry)
         bridge.qobj.cam_jpeg.connect(self._on_cam_jpeg)
         bridge.qobj.cam_meta.connect(self._on_cam_meta)
@@ -1109,8 +1456,18 @@ class MainWindow:
 
         self._key_filter = _KeyFilter(self)
 
+        # IMU display: newest sample per tick
+        self._raw_last_render_ns = 0
+        self._imu_timer = QTimer()
+        self._imu_timer.timeout.connect(self._tick_imu)
+        self._imu_timer.start(int(1000.0 / _IMU_POLL_HZ))
+
         # LiDAR update throttling
         self._lidar_last_scan: Optional[dict[str, Any]] = None
+        # Per-tick scratch: XY output (bounded by the max points control) and two filter
+        # masks (grown to the largest scan seen), so ticks do not allocate them.
+        self._lidar_xy = np.empty((_LIDAR_MAX_POINTS_CAP, 2), dtype=np.float32)
+        self._lidar_masks = np.empty((2, 0), dtype=np.bool_)
         self._lidar_timer = QTimer()
         self._lidar_timer.timeout.connect(self._tick_lidar)
         self._lidar_timer.start(max(10, int(1000.0 / float(self._ui_config.lidar_update_hz))))
@@ -1134,22 +1491,21 @@ class MainWindow:
         self._log.appendPlainText(f"[{ts}] {msg}")
 
     def _event_filter(self, obj: Any, event: Any) -> bool:
-        from PySide6.QtWidgets import QApplication, QPlainTextEdit
-
-        if event.type() in (self._QEvent.ApplicationDeactivate, self._QEvent.WindowDeactivate):
+        etype = event.type()
+        if etype in self._deactivate_events:
             if self._pressed:
                 self._pressed.clear()
                 self._send_stop(repeat=2)
             return False
 
-        if event.type() not in (self._QEvent.KeyPress, self._QEvent.KeyRelease):
+        if etype not in self._key_events:
             return False
 
-        focused = QApplication.focusWidget()
+        focused = self._QApplication.focusWidget()
 
         # ESC clears focus so motor keys won't modify focused input widgets (spinboxes, text fields).
         # After clearing, focus goes to the main window so motor keys work immediately.
-        if event.type() == self._QEvent.KeyPress:
+        if etype == self._QEvent.KeyPress:
             try:
                 if event.key() == self._Qt.Key_Escape and focused is not None:
                     focused.clearFocus()
@@ -1159,34 +1515,20 @@ class MainWindow:
                 pass
 
         if focused is not None:
-            if isinstance(focused, QPlainTextEdit) and focused.isReadOnly():
+            if isinstance(focused, self._QPlainTextEdit) and focused.isReadOnly():
                 pass
             elif isinstance(focused, self._typing_widgets):
                 return False
 
         ev = event  # QKeyEvent
         key = ev.key()
-        if key not in (
-            self._Qt.Key_R,
-            self._Qt.Key_F,
-            self._Qt.Key_U,
-            self._Qt.Key_J,
-            self._Qt.Key_W,
-            self._Qt.Key_A,
-            self._Qt.Key_S,
-            self._Qt.Key_X,
-            self._Qt.Key_D,
-            self._Qt.Key_Q,
-            self._Qt.Key_E,
-            self._Qt.Key_Z,
-            self._Qt.Key_C,
-        ):
+        if key not in self._motor_keys:
             return False
 
-        if event.type() == self._QEvent.KeyPress and not ev.isAutoRepeat():
+        if etype == self._QEvent.KeyPress and not ev.isAutoRepeat():
             self._pressed.add(key)
             return True
-        if event.type() == self._QEvent.KeyRelease and not ev.isAutoRepeat():
+        if etype == self._QEvent.KeyRelease and not ev.isAutoRepeat():
             self._pressed.discard(key)
             if not self._pressed:
                 self._send_stop(repeat=2)
@@ -1208,10 +1550,8 @@ class MainWindow:
             pass
 
         try:
-            self._buf_t.clear()
-            self._buf_x.clear()
-            self._buf_y.clear()
-            self._buf_z.clear()
+            self._imu_head = 0
+            self._imu_count = 0
             self._curve_x.setData([], [])
             self._curve_y.setData([], [])
             self._curve_z.setData([], [])
@@ -1226,33 +1566,24 @@ class MainWindow:
         # - S/X: backward
         # - A/D: rotate left/right (0.3x)
         # - Q/E/Z/C: diagonal shortcut (W+A / W+D / S+A / S+D), with inside wheel 0.5x
-        composite_keys = (
-            self._Qt.Key_W,
-            self._Qt.Key_A,
-            self._Qt.Key_S,
-            self._Qt.Key_X,
-            self._Qt.Key_D,
-            self._Qt.Key_Q,
-            self._Qt.Key_E,
-            self._Qt.Key_Z,
-            self._Qt.Key_C,
-        )
-        if any(k in self._pressed for k in composite_keys):
-            forward = self._Qt.Key_W in self._pressed
-            backward = (self._Qt.Key_S in self._pressed) or (self._Qt.Key_X in self._pressed)
-            turn_left = self._Qt.Key_A in self._pressed
-            turn_right = self._Qt.Key_D in self._pressed
-
-            if self._Qt.Key_Q in self._pressed:
+        Qt = self._Qt
+        pressed = self._pressed
+        if not pressed.isdisjoint(self._composite_keys):
+            forward = Qt.Key_W in pressed
+            backward = (Qt.Key_S in pressed) or (Qt.Key_X in pressed)
+            turn_left = Qt.Key_A in pressed
+            turn_right = Qt.Key_D in pressed
+
+            if Qt.Key_Q in pressed:
                 forward = True
                 turn_left = True
-            if self._Qt.Key_E in self._pressed:
+            if Qt.Key_E in pressed:
                 forward = True
                 turn_right = True
-            if self._Qt.Key_Z in self._pressed:
+            if Qt.Key_Z in pressed:
                 backward = True
                 turn_left = True
-            if self._Qt.Key_C in self._pressed:
+            if Qt.Key_C in pressed:
                 backward = True
                 turn_right = True
 
@@ -1279,14 +1610,14 @@ class MainWindow:
         left = 0.0
         right = 0.0
 
-        if self._Qt.Key_R in self._pressed:
+        if Qt.Key_R in pressed:
             left += step
-        if self._Qt.Key_F in self._pressed:
+        if Qt.Key_F in pressed:
             left -= step
 
-        if self._Qt.Key_U in self._pressed:
+        if Qt.Key_U in pressed:
             right += step
-        if self._Qt.Key_J in self._pressed:
+        if Qt.Key_J in pressed:
             right -= step
 
         return left, right
@@ -1310,17 +1641,17 @@ class MainWindow:
             unit="mps",
             deadman_ms=int(self._spin_deadman.value()),
             seq=self._seq,
-            ts_ms=int(time.time() * 1000),
+            ts_ms=time.time_ns() // 1_000_000,
         )
         self._seq += 1
         try:
-            now = time.monotonic()
+            now = time.monotonic_ns()
             # Avoid flooding the terminal: by default print only on change or <=1 Hz.
             if self._print_publish and not self._print_pub_motor_all:
                 cur = (cmd.v_l, cmd.v_r)
-                if (cur != self._last_motor_print) or (now - self._last_motor_print_t >= 1.0):
+                if (cur != self._last_motor_print) or (now - self._last_motor_print_ns >= 1_000_000_000):
                     self._last_motor_print = cur
-                    self._last_motor_print_t = now
+                    self._last_motor_print_ns = now
                     self._client.publish_motor_ex(cmd, print_msg=True)
                 else:
                     self._client.publish_motor_ex(cmd, print_msg=False)
@@ -1333,9 +1664,9 @@ class MainWindow:
         except Exception as e:
             self._append_log(f"motor publish failed: {e}")
 
-    def _record_motor_pub(self, now: float) -> None:
-        last = self._motor_last_pub_t
-        self._motor_last_pub_t = now
+    def _record_motor_pub(self, now: int) -> None:
+        last = self._motor_last_pub_ns
+        self._motor_last_pub_ns = now
         if last is None:
             return
 
@@ -1343,17 +1674,21 @@ class MainWindow:
         if dt <= 0:
             return
 
-        self._motor_dt_s.append(dt)
-        dt_ms = dt * 1000.0
-        avg = sum(self._motor_dt_s) / max(1, len(self._motor_dt_s))
-        avg_ms = avg * 1000.0
-        hz = 1.0 / avg if avg > 0 else 0.0
+        window = self._motor_dt_ns
+        if len(window) == window.maxlen:
+            self._motor_dt_sum_ns -= window[0]
+        window.append(dt)
+        self._motor_dt_sum_ns += dt
+        n = len(window)
+        dt_ms = dt / 1e6
+        avg_ms = self._motor_dt_sum_ns / n / 1e6
+        hz = 1000.0 / avg_ms if avg_ms > 0 else 0.0
         self._lbl_motor_period.setText(f"dt={dt_ms:5.1f}ms avg={avg_ms:5.1f}ms ({hz:4.1f}Hz)")
 
-        if self._print_motor_period and (now - self._motor_period_last_print_t >= 1.0):
-            self._motor_period_last_print_t = now
+        if self._print_motor_period and (now - self._motor_period_last_print_ns >= 1_000_000_000):
+            self._motor_period_last_print_ns = now
             print(
-                f"[motor period] dt={dt_ms:.1f}ms avg={avg_ms:.1f}ms hz={hz:.2f} (n={len(self._motor_dt_s)})",
+                f"[motor period] dt={dt_ms:.1f}ms avg={avg_ms:.1f}ms hz={hz:.2f} (n={n})",
                 flush=True,
             )
 
@@ -1366,11 +1701,11 @@ class MainWindow:
                 unit="mps",
                 deadman_ms=int(self._spin_deadman.value()),
                 seq=self._seq,
-                ts_ms=int(time.time() * 1000),
+                ts_ms=time.time_ns() // 1_000_000,
             )
             self._seq += 1
             try:
-                now = time.monotonic()
+                now = time.monotonic_ns()
                 if self._print_publish and self._print_pub_motor_all:
                     self._client.publish_motor_ex(cmd, print_msg=True)
                 else:
@@ -1442,11 +1777,21 @@ class MainWindow:
             f"cmd_v_l={cmd_v_l_s} cmd_v_r={cmd_v_r_s} seq={cmd_seq_s} ts_ms={cmd_ts_s}"
         )
 
+    def _tick_imu(self) -> None:
+        payload = self._bridge.imu_latest.take()
+        if payload is not None:
+            self._on_imu(payload)
+
     def _on_imu(self, payload: Any) -> None:
-        try:
-            self._raw.setPlainText(json.dumps(payload, ensure_ascii=False, indent=2))
-        except Exception:
-            self._raw.setPlainText(str(payload))
+        # The raw view appends at most one line every 100 ms (appending a short block is
+        # cheap; rebuilding the document was not); labels and plot keep full rate.
+        now_ns = time.monotonic_ns()
+        if now_ns - self._raw_last_render_ns >= _IMU_RAW_RENDER_INTERVAL_NS:
+            self._raw_last_render_ns = now_ns
+            try:
+                self._raw.appendPlainText(_dumps_text(payload))
+            except Exception:
+                self._raw.appendPlainText(str(payload))
 
         gyro_candidates = ("gyro", "gyr", "angular_velocity", "angularVelocity")
         accel_candidates = ("accel", "acc", "acceleration", "linear_acceleration", "linearAcceleration")
@@ -1490,36 +1835,48 @@ class MainWindow:
 
         x, y, z = vec
         t = time.monotonic() - self._t0
-        self._buf_t.append(t)
-        self._buf_x.append(x)
-        self._buf_y.append(y)
-        self._buf_z.append(z)
-        self._curve_x.setData(list(self._buf_t), list(self._buf_x))
-        self._curve_y.setData(list(self._buf_t), list(self._buf_y))
-        self._curve_z.setData(list(self._buf_t), list(self._buf_z))
+        ring = self._imu_ring
+        head = self._imu_head
+        sample = (t, x, y, z)
+        ring[:, head] = sample
+        ring[:, head + _IMU_PLOT_LEN] = sample
+        head = (head + 1) % _IMU_PLOT_LEN
+        self._imu_head = head
+        count = min(self._imu_count + 1, _IMU_PLOT_LEN)
+        self._imu_count = count
+        end = head + _IMU_PLOT_LEN
+        window = ring[:, end - count : end]
+        self._curve_x.setData(window[0], window[1])
+        self._curve_y.setData(window[0], window[2])
+        self._curve_z.setData(window[0], window[3])
 
     def _on_cam_meta(self, payload: Any) -> None:
         try:
-            self._lbl_cam_meta.setText("meta: " + json.dumps(payload, ensure_ascii=False))
+            self._lbl_cam_meta.setText("meta: " + _dumps_text(payload))
         except Exception:
             self._lbl_cam_meta.setText("meta: (decode failed)")
 
     def _on_cam_h264_meta(self, payload: Any) -> None:
         try:
-            self._lbl_cam_h264_meta.setText("h264 meta: " + json.dumps(payload, ensure_ascii=False))
+            self._lbl_cam_h264_meta.setText("h264 meta: " + _dumps_text(payload))
         except Exception:
             self._lbl_cam_h264_meta.setText("h264 meta: (decode failed)")
 
     def _on_cam_h264_frame(self, payload: Any) -> None:
-        from PySide6.QtGui import QImage, QPixmap
+        QImage = self._QImage
+        QPixmap = self._QPixmap
 
         try:
-            width, height, frame = payload
+            width, height, frame, release = payload
         except Exception:
             return
-        if not isinstance(width, int) or not isinstance(height, int) or not isinstance(frame, (bytes, bytearray)):
-            return
-        img = QImage(frame, width, height, QImage.Format_RGB888).copy()
+        try:
+            if not isinstance(width, int) or not isinstance(height, int):
+                return
+            # copy() detaches the image from the pooled buffer before it is released.
+            img = QImage(frame, width, height, QImage.Format_RGB888).copy()
+        finally:
+            release()
         if img.isNull():
             return
         pix = QPixmap.fromImage(img)
@@ -1528,10 +1885,15 @@ class MainWindow:
         )
         self._cam_h264_label.setPixmap(scaled)
 
-    def _on_cam_jpeg(self, jpg: bytes) -> None:
-        from PySide6.QtGui import QImage, QPixmap
+    def _on_cam_jpeg(self, jpg: bytes | memoryview) -> None:
+        QImage = self._QImage
+        QPixmap = self._QPixmap
 
-        img = QImage.fromData(jpg, "JPG")
+        try:
+            img = QImage.fromData(jpg, "JPG")
+        except TypeError:
+            # Older PySide6 builds only accept bytes here.
+            img = QImage.fromData(bytes(jpg), "JPG")
         if img.isNull():
             self._append_log(f"camera jpeg decode failed (bytes={len(jpg)})")
             return
@@ -1543,7 +1905,7 @@ class MainWindow:
 
     def _on_lidar_front(self, payload: Any) -> None:
         try:
-            self._lbl_lidar_front.setText("front: " + json.dumps(payload, ensure_ascii=False))
+            self._lbl_lidar_front.setText("front: " + _dumps_text(payload))
         except Exception:
             self._lbl_lidar_front.setText("front: (decode failed)")
 
@@ -1569,35 +1931,45 @@ class MainWindow:
         rmax = min(1.0, float(self._spin_lidar_range_m.value()))
 
         np = self._np
-        angles = np.fromiter((p[0] for p in pts), dtype=np.float64, count=n_total)
-        ranges = np.fromiter((p[1] for p in pts), dtype=np.float64, count=n_total)
-
-        mask = ranges > 0.0
+        if self._lidar_masks.shape[1] < n_total:
+            self._lidar_masks = np.empty((2, n_total), dtype=np.bool_)
+        keep = self._lidar_masks[0, :n_total]
+        tmp = self._lidar_masks[1, :n_total]
+        ranges = pts[:, 1]
+        np.greater(ranges, 0.0, out=keep)
+        np.logical_and(keep, np.isfinite(pts[:, 0], out=tmp), out=keep)
         if rmax > 0.0:
-            mask &= ranges <= rmax
-        angles = angles[mask]
-        ranges = ranges[mask]
+            np.logical_and(keep, np.less_equal(ranges, rmax, out=tmp), out=keep)
+        # One gather over the (N, 2) rows; the columns below are views of it.
+        pts = pts[keep]
 
-        n = int(angles.shape[0])
+        n = int(pts.shape[0])
         if n == 0:
             self._lbl_lidar.setText(f"scan: seq={seq} ts_ms={ts_ms} points=0 (after filter)")
             self._lidar_scatter.setData(pos=[])
             return
 
         if n > max_points:
-            idx = np.linspace(0, n - 1, num=max_points, dtype=np.int64)
-            angles = angles[idx]
-            ranges = ranges[idx]
-            n = int(angles.shape[0])
+            # Even stride as a view: no index array and no gather. ceil(n / max_points)
+            # keeps the result within max_points.
+            step = -(-n // max_points)
+            pts = pts[::step]
+            n = int(pts.shape[0])
+        angles = pts[:, 0]
+        ranges = pts[:, 1]
 
         # Convert to XY where robot front is +Y (up) and angle_rad=0 points forward.
         # x is right, y is forward.
-        x = ranges * np.sin(angles)
-        y = ranges * np.cos(angles)
+        # Computed in float32 straight into the (n, 2) array handed to the scatter plot:
+        # no per-axis temporaries and no column_stack copy. The scatter item copies the
+        # positions, so the scratch buffer is free again for the next tick.
+        pos = self._lidar_xy[:n]
+        np.sin(angles, out=pos[:, 0])
+        np.cos(angles, out=pos[:, 1])
+        pos *= ranges[:, None]
         if self._chk_lidar_flip_y.isChecked():
-            y = -y
-        pos = np.column_stack((x, y))
-        self._lidar_scatter.setData(pos=pos)
+            np.negative(pos[:, 1], out=pos[:, 1])
+        self._lidar_scatter.setData(x=pos[:, 0], y=pos[:, 1])
 
         # Display area is fixed to 2m x 2m centered at origin.
         # rmax is only used as a distance filter (and capped to <= 1.0 above).
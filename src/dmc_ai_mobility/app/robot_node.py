@@ -27,7 +27,7 @@ from dmc_ai_mobility.drivers.lidar import MockLidarDriver, YdLidarConfig, YdLida
 from dmc_ai_mobility.drivers.motor import MockMotorDriver, PigpioMotorConfig, PigpioMotorDriver
 from dmc_ai_mobility.drivers.oled import MockOledDriver, Ssd1306OledConfig, Ssd1306OledDriver
 from dmc_ai_mobility.zenoh import keys
-from dmc_ai_mobility.zenoh.pubsub import publish_json, subscribe_json
+from dmc_ai_mobility.zenoh.pubsub import publish_json, subscribe_json, subscribe_json_or_msgpack
 from dmc_ai_mobility.zenoh.session import ZenohOpenOptions, open_session
 
 logger = logging.getLogger(__name__)
@@ -44,8 +44,10 @@ def _load_motor_trim(path: Path) -> float:
 
 
 def _lidar_front_distance(points: list[dict], *, window_deg: float, stat: str) -> Optional[tuple[float, int]]:
-    half = max(float(window_deg), 0.0) / 2.0
+    # Compare in radians so the per-point loop avoids a math.degrees call.
+    half_rad = math.radians(max(float(window_deg), 0.0)) / 2.0
     dists: list[float] = []
+    append = dists.append
     for p in points:
         try:
             angle_rad = float(p.get("angle_rad"))
@@ -54,8 +56,8 @@ def _lidar_front_distance(points: list[dict], *, window_deg: float, stat: str) -
             continue
         if dist <= 0.0:
             continue
-        if abs(math.degrees(angle_rad)) <= half:
-            dists.append(dist)
+        if abs(angle_rad) <= half_rad:
+            append(dist)
     if not dists:
         return None
     if str(stat).lower() == "min":
@@ -187,7 +189,7 @@ def run_robot(
     def on_motor_cmd(data: dict) -> None:
         nonlocal last_motor_cmd, last_motor_cmd_ms, motor_deadman_ms, motor_active, last_motor_log_ms
         try:
-            # motor/cmd（JSON）を解釈して左右速度（m/s）を適用する。
+            # motor/cmd（JSON または msgpack）を解釈して左右速度（m/s）を適用する。
             cmd = MotorCmd.from_dict(data)
         except Exception as e:
             logger.warning("invalid motor cmd: %s", e)
@@ -272,7 +274,7 @@ def run_robot(
             oled_override_until_ms = monotonic_ms() + oled_override_ms
 
     subs = [
-        subscribe_json(session, keys.motor_cmd(robot_id), on_motor_cmd),
+        subscribe_json_or_msgpack(session, keys.motor_cmd(robot_id), on_motor_cmd),
         subscribe_json(session, keys.oled_cmd(robot_id), on_oled_cmd),
         session.subscribe(keys.oled_image_mono1(robot_id), on_oled_image_mono1),
     ]
@@ -3,7 +3,8 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional, Protocol
+from functools import cached_property
+from typing import Any, Optional, Protocol
 
 from dmc_ai_mobility.core.timing import wall_clock_ms
 
@@ -17,11 +18,38 @@ class LidarPoint:
     intensity: Optional[float] = None
 
 
+def _require_numpy() -> Any:
+    try:
+        import numpy as np  # type: ignore
+    except Exception as e:  # pragma: no cover
+        raise RuntimeError("numpy is required for LidarScan array access (pip install numpy)") from e
+    return np
+
+
 @dataclass(frozen=True)
 class LidarScan:
     points: list[LidarPoint]
     ts_ms: int
 
+    @cached_property
+    def _arrays(self) -> tuple[Any, Any]:
+        # Built once per scan on first access (structure-of-arrays view of `points`).
+        np = _require_numpy()
+        n = len(self.points)
+        angles = np.fromiter((p.angle_rad for p in self.points), dtype=np.float64, count=n)
+        ranges = np.fromiter((p.range_m for p in self.points), dtype=np.float64, count=n)
+        return angles, ranges
+
+    @property
+    def angles_rad(self) -> Any:
+        """Point angles as a float64 ndarray (requires numpy)."""
+        return self._arrays[0]
+
+    @property
+    def ranges_m(self) -> Any:
+        """Point ranges as a float64 ndarray (requires numpy)."""
+        return self._arrays[1]
+
 
 class LidarDriver(Protocol):
     def read(self) -> Optional[LidarScan]: ...
@@ -5,6 +5,8 @@ import time
 from dataclasses import dataclass
 from typing import Optional, Protocol
 
+from dmc_ai_mobility.drivers.pigpio_conn import get_pi, release_pi
+
 logger = logging.getLogger(__name__)
 
 _PIGPIO_SERVO_MIN_PW = 500
@@ -107,15 +109,9 @@ class PigpioMotorConfig:
 
 class PigpioMotorDriver:
     def __init__(self, config: PigpioMotorConfig) -> None:
-        try:
-            import pigpio  # type: ignore
-        except Exception as e:  # pragma: no cover
-            raise RuntimeError("pigpio is required for PigpioMotorDriver") from e
-
-        self._pigpio = pigpio
-        self._pi = pigpio.pi()
-        if not self._pi.connected:  # pragma: no cover
-            raise RuntimeError("pigpio daemon is not running or not reachable")
+        # Shared connection; close() releases it and the last user stops it.
+        self._pi = get_pi()
+        self._released = False
         self._cfg = config
         self._last_clamp_warn_ms = 0.0
         self._last_pulsewidth = MotorPulsewidth(0, 0, 0, 0, 0, 0)
@@ -158,7 +154,11 @@ class PigpioMotorDriver:
             )
 
     def close(self) -> None:
+        # Release our reference only once; a second release would drop another user's.
+        if self._released:
+            return
+        self._released = True
         try:
             self.stop()
         finally:
-            self._pi.stop()
+            release_pi()
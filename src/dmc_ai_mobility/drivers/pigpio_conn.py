@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import Any, Optional
+
+_PI: Optional[Any] = None
+_PI_USERS = 0
+_PI_LOCK = threading.Lock()
+
+
+def get_pi() -> Any:
+    """Return the process-wide ``pigpio.pi`` connection, connecting on first use.
+
+    All callers share one daemon socket (and one notify thread). Each call must be
+    paired with ``release_pi()``; callers must not call ``stop()`` on it themselves.
+    The connection is stopped when the last user releases it, or at interpreter exit.
+    """
+    global _PI, _PI_USERS
+    with _PI_LOCK:
+        if _PI is None:
+            try:
+                import pigpio  # type: ignore
+            except Exception as e:  # pragma: no cover
+                raise RuntimeError("pigpio is required for GPIO access (pip install pigpio)") from e
+
+            pi = pigpio.pi()
+            if not pi.connected:  # pragma: no cover
+                raise RuntimeError("pigpio daemon is not running or not reachable")
+            _PI = pi
+        _PI_USERS += 1
+        return _PI
+
+
+def release_pi() -> None:
+    """Drop one ``get_pi()`` reference; stops the connection after the last one."""
+    global _PI, _PI_USERS
+    with _PI_LOCK:
+        if _PI is None:
+            return
+        _PI_USERS = max(0, _PI_USERS - 1)
+        if _PI_USERS:
+            return
+        pi, _PI = _PI, None
+    pi.stop()
+
+
+def _stop_at_exit() -> None:
+    global _PI, _PI_USERS
+    with _PI_LOCK:
+        pi, _PI = _PI, None
+        _PI_USERS = 0
+    if pi is not None:
+        pi.stop()
+
+
+atexit.register(_stop_at_exit)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Callable, Dict
 
-from dmc_ai_mobility.zenoh.schemas import decode_json, encode_json
+from dmc_ai_mobility.zenoh.schemas import decode_json, decode_json_or_msgpack_frames, encode_json
 from dmc_ai_mobility.zenoh.session import Session, Subscription
 
 
@@ -15,3 +15,15 @@ def subscribe_json(session: Session, key: str, callback: Callable[[Dict[str, Any
         callback(decode_json(payload))
 
     return session.subscribe(key, _wrapped)
+
+
+def subscribe_json_or_msgpack(
+    session: Session, key: str, callback: Callable[[Dict[str, Any]], None]
+) -> Subscription:
+    def _wrapped(payload: bytes) -> None:
+        # A batched payload carries several commands; applying them in order leaves
+        # the newest one in effect.
+        for data in decode_json_or_msgpack_frames(payload):
+            callback(data)
+
+    return session.subscribe(key, _wrapped)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+import struct
+from typing import Any, Dict, List
 
 
 def encode_json(data: Dict[str, Any]) -> bytes:
@@ -18,6 +19,68 @@ def decode_json(payload: bytes) -> Dict[str, Any]:
     raise ValueError("expected JSON object")
 
 
+def decode_msgpack(payload: bytes) -> Dict[str, Any]:
+    try:
+        import msgspec  # type: ignore
+    except Exception as e:  # pragma: no cover
+        raise RuntimeError("msgspec is required for msgpack payloads (pip install msgspec)") from e
+
+    value = msgspec.msgpack.decode(payload)
+    if isinstance(value, dict):
+        return value
+    raise ValueError("expected msgpack map")
+
+
+def _is_msgpack_map(first: int) -> bool:
+    # fixmap (0x80-0x8f), map16 (0xde), map32 (0xdf). A JSON object starts with
+    # "{" or ASCII whitespace, so the two encodings never collide.
+    return 0x80 <= first <= 0x8F or first in (0xDE, 0xDF)
+
+
+def decode_json_or_msgpack(payload: bytes) -> Dict[str, Any]:
+    if payload and _is_msgpack_map(payload[0]):
+        return decode_msgpack(payload)
+    return decode_json(payload)
+
+
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def encode_frames(payloads: List[bytes]) -> bytes:
+    """Join payloads as ``[4-byte big-endian length][payload]`` frames."""
+    pack = _FRAME_HEADER.pack
+    return b"".join(pack(len(p)) + p for p in payloads)
+
+
+def is_framed(payload: bytes) -> bool:
+    # A frame header for a payload under 16 MiB starts with 0x00, which neither a
+    # JSON object nor a msgpack map can.
+    return bool(payload) and payload[0] == 0
+
+
+def split_frames(payload: bytes) -> List[bytes]:
+    view = memoryview(payload)
+    out: List[bytes] = []
+    pos = 0
+    header = _FRAME_HEADER.size
+    while pos < len(view):
+        if pos + header > len(view):
+            raise ValueError("truncated frame header")
+        (length,) = _FRAME_HEADER.unpack_from(view, pos)
+        pos += header
+        if pos + length > len(view):
+            raise ValueError("truncated frame")
+        out.append(bytes(view[pos : pos + length]))
+        pos += length
+    return out
+
+
+def decode_json_or_msgpack_frames(payload: bytes) -> List[Dict[str, Any]]:
+    if is_framed(payload):
+        return [decode_json_or_msgpack(p) for p in split_frames(payload)]
+    return [decode_json_or_msgpack(payload)]
+
+
 MOTOR_CMD_SCHEMA = {
     "key": "dmc_robo/<robot_id>/motor/cmd",
     "json": {
@@ -28,6 +91,8 @@ MOTOR_CMD_SCHEMA = {
         "seq": "int (optional)",
         "ts_ms": "int (optional)",
     },
+    "msgpack": "same fields as json, encoded as a msgpack map (accepted alongside JSON)",
+    "batch": "concatenated [4-byte big-endian length][json|msgpack] frames, applied in order",
 }
 
 MOTOR_TELEMETRY_SCHEMA = {
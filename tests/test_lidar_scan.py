@@ -0,0 +1,32 @@
+import importlib.util
+import unittest
+from pathlib import Path
+import sys
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+
+from dmc_ai_mobility.drivers.lidar import LidarPoint, LidarScan, MockLidarDriver  # noqa: E402
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+class TestLidarScanArrays(unittest.TestCase):
+    def test_arrays_match_points(self) -> None:
+        scan = LidarScan(
+            points=[LidarPoint(angle_rad=0.5, range_m=1.0), LidarPoint(angle_rad=-0.25, range_m=2.5)],
+            ts_ms=0,
+        )
+        self.assertEqual(scan.angles_rad.tolist(), [0.5, -0.25])
+        self.assertEqual(scan.ranges_m.tolist(), [1.0, 2.5])
+
+    def test_arrays_built_once(self) -> None:
+        scan = MockLidarDriver().read()
+        assert scan is not None
+        self.assertIs(scan.angles_rad, scan.angles_rad)
+        self.assertEqual(len(scan.ranges_m), len(scan.points))
+
+
+if __name__ == "__main__":
+    unittest.main()
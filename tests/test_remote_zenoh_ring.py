@@ -0,0 +1,53 @@
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+
+ROOT = Path(__file__).resolve().parents[1]
+_spec = importlib.util.spec_from_file_location("remote_zenoh_tool", ROOT / "examples" / "remote_zenoh_tool.py")
+remote_zenoh_tool = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = remote_zenoh_tool
+_spec.loader.exec_module(remote_zenoh_tool)
+
+_MmapRing = remote_zenoh_tool._MmapRing
+
+
+class TestMmapRing(unittest.TestCase):
+    def _ring(self, td: str, size: int) -> tuple[_MmapRing, Path]:
+        path = Path(td) / "ring.bin"
+        ring = _MmapRing(str(path), size)
+        self.addCleanup(ring.close)
+        return ring, path
+
+    def _records(self, path: Path) -> list[bytes]:
+        return [bytes(r) for r in _MmapRing.records(path.read_bytes())]
+
+    def test_rejects_empty_frame(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            ring, path = self._ring(td, 256)
+            ring.append(b"abc")
+            with self.assertRaises(ValueError):
+                ring.append(b"")
+            self.assertEqual(self._records(path), [b"abc"])
+
+    def test_keeps_newest_frames_after_wrap(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            ring, path = self._ring(td, 64)
+            frames = [bytes([i]) * (5 + i % 7) for i in range(40)]
+            for frame in frames:
+                ring.append(frame)
+            got = self._records(path)
+            self.assertTrue(got)
+            self.assertEqual(got, frames[-len(got) :])
+
+    def test_rejects_oversized_frame(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            ring, _ = self._ring(td, 64)
+            with self.assertRaises(ValueError):
+                ring.append(b"x" * 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import importlib.util
+import unittest
+from pathlib import Path
+import sys
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+
+from dmc_ai_mobility.zenoh.schemas import (  # noqa: E402
+    decode_json_or_msgpack,
+    decode_json_or_msgpack_frames,
+    encode_frames,
+    encode_json,
+)
+
+
+class TestDecodeJsonOrMsgpack(unittest.TestCase):
+    def test_json_payload(self) -> None:
+        payload = encode_json({"v_l": 0.1, "v_r": 0.2, "seq": 3})
+        self.assertEqual(decode_json_or_msgpack(payload), {"v_l": 0.1, "v_r": 0.2, "seq": 3})
+
+    def test_json_with_leading_whitespace(self) -> None:
+        self.assertEqual(decode_json_or_msgpack(b' {"v_l": 0}'), {"v_l": 0})
+
+    @unittest.skipUnless(importlib.util.find_spec("msgspec"), "msgspec is not installed")
+    def test_msgpack_payload(self) -> None:
+        import msgspec
+
+        payload = msgspec.msgpack.encode({"v_l": 0.1, "v_r": 0.2, "unit": "mps", "seq": 3})
+        self.assertEqual(
+            decode_json_or_msgpack(payload), {"v_l": 0.1, "v_r": 0.2, "unit": "mps", "seq": 3}
+        )
+
+
+class TestFrames(unittest.TestCase):
+    def test_single_payload_is_not_framed(self) -> None:
+        self.assertEqual(decode_json_or_msgpack_frames(b'{"seq":1}'), [{"seq": 1}])
+
+    def test_batch_round_trip(self) -> None:
+        payload = encode_frames([encode_json({"seq": 1}), encode_json({"seq": 2})])
+        self.assertEqual(decode_json_or_msgpack_frames(payload), [{"seq": 1}, {"seq": 2}])
+
+    def test_truncated_batch_raises(self) -> None:
+        payload = encode_frames([encode_json({"seq": 1})])
+        with self.assertRaises(ValueError):
+            decode_json_or_msgpack_frames(payload[:-1])
+
+
+if __name__ == "__main__":
+    unittest.main()